@@ -366,18 +366,32 @@ pub async fn write_user_message(
             timestamp: chrono_now_iso(),
         };
         if pipe_state.send(pipe_msg).is_ok() {
-            // Also write to inbox.json for persistence/fallback
-            let _ = crate::services::inbox_watcher::write_inbox_message(
-                &sender, &message, Some(&tid),
-            );
+            // Also write to inbox.json for persistence/fallback. Awaited so
+            // back-to-back messages land in the file in send order; the
+            // message is already delivered, so a failed write is only logged.
+            let written = tokio::task::spawn_blocking(move || {
+                crate::services::inbox_watcher::write_inbox_message(&sender, &message, Some(&tid))
+            })
+            .await;
+            match written {
+                Ok(Ok(())) => {}
+                Ok(Err(e)) => tracing::warn!("Inbox persist after pipe send failed: {}", e),
+                Err(e) => tracing::warn!("Inbox persist task failed: {}", e),
+            }
             return Ok(IpcResponse::ok_empty());
         }
     }
 
-    // Fallback: file-based inbox
-    match crate::services::inbox_watcher::write_inbox_message(&sender, &message, Some(&tid)) {
-        Ok(()) => Ok(IpcResponse::ok_empty()),
-        Err(e) => Ok(IpcResponse::err(e)),
+    // Fallback: file-based inbox. The read-modify-write of inbox.json is
+    // blocking I/O, so keep it off the async runtime's worker threads.
+    let written = tokio::task::spawn_blocking(move || {
+        crate::services::inbox_watcher::write_inbox_message(&sender, &message, Some(&tid))
+    })
+    .await;
+    match written {
+        Ok(Ok(())) => Ok(IpcResponse::ok_empty()),
+        Ok(Err(e)) => Ok(IpcResponse::err(e)),
+        Err(e) => Ok(IpcResponse::err(format!("Inbox write task failed: {}", e))),
     }
 }
 
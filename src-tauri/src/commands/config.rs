@@ -8,6 +8,7 @@ use std::sync::Mutex;
 
 use once_cell::sync::Lazy;
 use serde_json::Value;
+use tauri::{AppHandle, Manager};
 
 /// Global config state, protected by a mutex.
 /// Loaded once on first access, then kept in memory.
@@ -24,6 +25,23 @@ pub(crate) fn get_config_snapshot() -> AppConfig {
         .clone()
 }
 
+/// Drop the TTS engine kept loaded for a quick voice restart if the TTS
+/// settings changed, so a stale Kokoro model doesn't stay in memory.
+fn drop_stale_preloaded_tts(app: &AppHandle, old: &AppConfig, new: &AppConfig) {
+    let (old, new) = (&old.voice, &new.voice);
+    if old.tts_adapter == new.tts_adapter
+        && old.tts_voice == new.tts_voice
+        && old.tts_speed == new.tts_speed
+    {
+        return;
+    }
+    if let Some(state) = app.try_state::<crate::PreloadedTtsState>() {
+        if state.lock().unwrap_or_else(|e| e.into_inner()).take().is_some() {
+            tracing::info!("TTS settings changed, dropped pre-loaded TTS engine");
+        }
+    }
+}
+
 /// Get the full config.
 #[tauri::command]
 pub fn get_config() -> IpcResponse {
@@ -39,7 +57,7 @@ pub fn get_config() -> IpcResponse {
 
 /// Update config with a partial patch (deep merge).
 #[tauri::command]
-pub fn set_config(patch: Value) -> IpcResponse {
+pub fn set_config(app: AppHandle, patch: Value) -> IpcResponse {
     let mut guard = match CONFIG.lock() {
         Ok(g) => g,
         Err(e) => return IpcResponse::err(format!("Failed to lock config: {}", e)),
@@ -63,13 +81,14 @@ pub fn set_config(patch: Value) -> IpcResponse {
         return IpcResponse::err(e);
     }
 
+    drop_stale_preloaded_tts(&app, &guard, &updated);
     *guard = updated;
     IpcResponse::ok(merged)
 }
 
 /// Reset config to defaults.
 #[tauri::command]
-pub fn reset_config() -> IpcResponse {
+pub fn reset_config(app: AppHandle) -> IpcResponse {
     let mut guard = match CONFIG.lock() {
         Ok(g) => g,
         Err(e) => return IpcResponse::err(format!("Failed to lock config: {}", e)),
@@ -81,6 +100,7 @@ pub fn reset_config() -> IpcResponse {
         return IpcResponse::err(e);
     }
 
+    drop_stale_preloaded_tts(&app, &guard, &default);
     *guard = default;
 
     match serde_json::to_value(&*guard) {
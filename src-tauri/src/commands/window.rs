@@ -63,16 +63,19 @@ pub fn save_window_bounds(app: AppHandle) -> IpcResponse {
         }
     });
 
-    // Use the set_config command logic to persist
-    // We import the persistence and platform modules directly to avoid
-    // circular dependencies with the config command's static CONFIG.
+    // Merge into the in-memory config rather than re-reading config.json:
+    // the cached copy is authoritative, and updating it keeps a later
+    // set_config from writing back stale orb coordinates.
+    use super::config::CONFIG;
     use crate::config::persistence;
     use crate::services::platform;
 
-    let config_dir = platform::get_config_dir();
-    let current_config = persistence::load_config(&config_dir);
+    let mut guard = match CONFIG.lock() {
+        Ok(g) => g,
+        Err(e) => return IpcResponse::err(format!("Failed to lock config: {}", e)),
+    };
 
-    let current_val = match serde_json::to_value(&current_config) {
+    let current_val = match serde_json::to_value(&*guard) {
         Ok(v) => v,
         Err(e) => return IpcResponse::err(format!("Serialize error: {}", e)),
     };
@@ -84,9 +87,11 @@ pub fn save_window_bounds(app: AppHandle) -> IpcResponse {
         Err(e) => return IpcResponse::err(format!("Invalid config: {}", e)),
     };
 
+    let config_dir = platform::get_config_dir();
     if let Err(e) = persistence::save_config(&config_dir, &updated) {
         return IpcResponse::err(e);
     }
+    *guard = updated;
 
     IpcResponse::ok(serde_json::json!({
         "x": position.x,
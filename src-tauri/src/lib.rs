@@ -23,7 +23,7 @@ use tracing::{info, warn};
 
 /// Pre-loaded TTS engine state. Populated during app startup in a background
 /// task so the voice pipeline can use it immediately without cold-start delay.
-pub type PreloadedTtsState = std::sync::Mutex<Option<Box<dyn voice::tts::TtsEngine>>>;
+pub type PreloadedTtsState = std::sync::Mutex<Option<voice::PreloadedTts>>;
 
 
 #[cfg_attr(mobile, tauri::mobile_entry_point)]
@@ -46,7 +46,7 @@ pub fn run() {
             std::sync::Mutex::new(shortcut_cmds::ShortcutManager::new()),
         ))
         .manage(std::sync::Mutex::new(sysinfo::System::new()) as window_cmds::PerfMonitorState)
-        .manage(std::sync::Mutex::new(None::<Box<dyn voice::tts::TtsEngine>>) as PreloadedTtsState)
+        .manage(std::sync::Mutex::new(None::<voice::PreloadedTts>) as PreloadedTtsState)
         .invoke_handler(tauri::generate_handler![
             // Config
             config_cmds::get_config,
@@ -213,11 +213,29 @@ pub fn run() {
 
             // Pre-load TTS engine in background so it's ready for the first message.
             // This avoids the cold-start "No TTS engine available" error.
-            {
+            // Build it from the voice engine's own config -- the settings the
+            // pipeline will start with -- so start() can actually reuse it.
+            // Only Kokoro is worth pre-loading (ONNX model + voices); the other
+            // adapters are cheap to build, so skip the model load for them.
+            let tts_cfg = app
+                .state::<voice_cmds::VoiceEngineState>()
+                .lock()
+                .unwrap_or_else(|e| e.into_inner())
+                .config()
+                .clone();
+            if tts_cfg.tts_adapter == "kokoro" {
                 let app_handle_tts = app.handle().clone();
                 tauri::async_runtime::spawn(async move {
-                    match tokio::task::spawn_blocking(|| {
-                        voice::tts::create_tts_engine("kokoro", Some("af_bella"), Some(1.0))
+                    let voice_name = tts_cfg.tts_voice.clone();
+                    let speed = tts_cfg.tts_speed;
+                    match tokio::task::spawn_blocking(move || {
+                        let engine = voice::tts::create_tts_engine(
+                            "kokoro",
+                            Some(&voice_name),
+                            Some(speed),
+                        )?;
+                        engine.warm_up();
+                        Ok::<_, voice::tts::TtsError>(engine)
                     })
                     .await
                     {
@@ -225,7 +243,12 @@ pub fn run() {
                             info!("TTS engine pre-loaded: {}", engine.name());
                             let state = app_handle_tts.state::<PreloadedTtsState>();
                             let mut guard = state.lock().expect("PreloadedTtsState poisoned");
-                            *guard = Some(engine);
+                            *guard = Some(voice::PreloadedTts {
+                                adapter: "kokoro".into(),
+                                voice: tts_cfg.tts_voice,
+                                speed,
+                                engine,
+                            });
                             drop(guard);
                         }
                         Ok(Err(e)) => {
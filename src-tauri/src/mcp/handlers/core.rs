@@ -5,6 +5,7 @@
 //! - Status: `{data_dir}/status.json` -- presence tracking
 //! - Lock:   `{data_dir}/listener_lock.json` -- exclusive listener lock
 
+use notify::{Event, EventKind, RecommendedWatcher, RecursiveMode, Watcher};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use std::collections::HashSet;
@@ -104,8 +105,8 @@ fn trigger_path(data_dir: &Path) -> PathBuf {
 
 /// Read and parse a JSON file, returning a default value if the file doesn't exist or is corrupt.
 async fn read_json_file<T: serde::de::DeserializeOwned>(path: &Path, default: T) -> T {
-    match tokio::fs::read_to_string(path).await {
-        Ok(data) => serde_json::from_str(&data).unwrap_or(default),
+    match tokio::fs::read(path).await {
+        Ok(data) => serde_json::from_slice(&data).unwrap_or(default),
         Err(_) => default,
     }
 }
@@ -193,6 +194,49 @@ fn rand_u32() -> u32 {
     ((addr as u64).wrapping_mul(6364136223846793005).wrapping_add(ts).wrapping_add(seq)) as u32
 }
 
+// ---------------------------------------------------------------------------
+// Inbox change notifications
+// ---------------------------------------------------------------------------
+
+/// Watch the data directory for writes to `inbox.json`.
+///
+/// Returns the watcher (which must be kept alive for the watch to stay active)
+/// and a receiver that wakes once per burst of inbox changes. Returns `None`
+/// if no OS watcher is available (e.g. some network filesystems), in which
+/// case callers fall back to interval polling.
+fn watch_inbox(data_dir: &Path) -> Option<(RecommendedWatcher, tokio::sync::mpsc::Receiver<()>)> {
+    // Capacity 1: a pending wake-up already covers any further changes.
+    let (tx, rx) = tokio::sync::mpsc::channel::<()>(1);
+
+    let watcher = notify::recommended_watcher(move |res: Result<Event, notify::Error>| {
+        let Ok(event) = res else { return };
+        if !matches!(event.kind, EventKind::Modify(_) | EventKind::Create(_)) {
+            return;
+        }
+        let is_inbox = event
+            .paths
+            .iter()
+            .any(|p| p.file_name().map(|f| f == "inbox.json").unwrap_or(false));
+        if is_inbox {
+            let _ = tx.try_send(());
+        }
+    });
+
+    let mut watcher = match watcher {
+        Ok(w) => w,
+        Err(e) => {
+            warn!("[MCP Core] Inbox watcher unavailable, using polling: {}", e);
+            return None;
+        }
+    };
+    if let Err(e) = watcher.watch(data_dir, RecursiveMode::NonRecursive) {
+        warn!("[MCP Core] Failed to watch {:?}, using polling: {}", data_dir, e);
+        return None;
+    }
+
+    Some((watcher, rx))
+}
+
 // ---------------------------------------------------------------------------
 // Heartbeat helper
 // ---------------------------------------------------------------------------
@@ -374,7 +418,7 @@ pub async fn handle_voice_send(
     let _ = tokio::fs::write(trigger_path(data_dir), &trigger_json).await;
 
     // Fast path: also send via named pipe for instant delivery to the Tauri app.
-    // This bypasses the file watcher debounce (~100ms) for sub-ms event delivery.
+    // This bypasses the file watcher round-trip for sub-ms event delivery.
     if let Some(pipe) = pipe {
         let pipe_msg = McpToApp::VoiceSend {
             from: instance_id.to_string(),
@@ -429,6 +473,7 @@ pub async fn handle_voice_inbox(args: &Value, data_dir: &Path) -> McpToolResult
     }
 
     let mut store: InboxStore = read_json_file(&path, InboxStore { messages: vec![] }).await;
+    let loaded_len = store.messages.len();
 
     // Auto-cleanup old messages (24h cutoff)
     let cutoff_ms = now_ms() - (AUTO_CLEANUP_HOURS * 60 * 60 * 1000);
@@ -440,52 +485,42 @@ pub async fn handle_voice_inbox(args: &Value, data_dir: &Path) -> McpToolResult
     // Cap at MAX_INBOX_TOTAL
     if store.messages.len() > MAX_INBOX_TOTAL {
         let start = store.messages.len() - MAX_INBOX_TOTAL;
-        store.messages = store.messages[start..].to_vec();
+        store.messages.drain(..start);
     }
 
     // Mark as read if requested (do this BEFORE filtering to avoid borrow issues)
     if mark_as_read {
-        let id_str = instance_id.to_string();
+        // Only rewrite the file if marking or cleanup actually changed it
+        let mut changed = store.messages.len() != loaded_len;
         for msg in &mut store.messages {
             if msg.from == instance_id {
                 continue;
             }
-            if !msg.read_by.contains(&id_str) {
-                msg.read_by.push(id_str.clone());
+            if !msg.read_by.iter().any(|r| r == instance_id) {
+                msg.read_by.push(instance_id.to_string());
+                changed = true;
             }
         }
-        if let Err(e) = atomic_write_json(&path, &store).await {
-            warn!("[MCP Core] Failed to mark messages as read: {}", e);
+        if changed {
+            if let Err(e) = atomic_write_json(&path, &store).await {
+                warn!("[MCP Core] Failed to mark messages as read: {}", e);
+            }
         }
     }
 
-    // Filter out own messages
+    // Select the last `limit` messages in one reverse pass, skipping our own.
+    // When filtering by read status: if mark_as_read was true we just marked
+    // them, so still show them all this time.
+    let check_read = !include_read && !mark_as_read;
     let mut inbox: Vec<&InboxMessage> = store
         .messages
         .iter()
+        .rev()
         .filter(|m| m.from != instance_id)
+        .filter(|m| !check_read || !m.read_by.iter().any(|r| r == instance_id))
+        .take(limit)
         .collect();
-
-    // Filter by read status (use original read_by before mark_as_read for consistency)
-    if !include_read {
-        inbox.retain(|m| {
-            // If mark_as_read was true, we just marked them -- still show them this time
-            if mark_as_read {
-                // Show all messages this time (they were just marked)
-                true
-            } else {
-                !m.read_by.contains(&instance_id.to_string())
-            }
-        });
-    }
-
-    // Apply limit (take last N)
-    let start = if inbox.len() > limit {
-        inbox.len() - limit
-    } else {
-        0
-    };
-    let inbox = &inbox[start..];
+    inbox.reverse();
 
     if inbox.is_empty() {
         return McpToolResult::text("No new messages.");
@@ -518,7 +553,8 @@ pub async fn handle_voice_inbox(args: &Value, data_dir: &Path) -> McpToolResult
 /// `voice_listen` -- Wait for new messages from a specific sender.
 ///
 /// When a pipe is available, listens for instant delivery via named pipe.
-/// Falls back to polling inbox.json every 5 seconds when no pipe is connected.
+/// Without a pipe, waits for filesystem change events on inbox.json, and
+/// only polls every 5 seconds if no OS file watcher is available.
 pub async fn handle_voice_listen(
     args: &Value,
     data_dir: &Path,
@@ -532,6 +568,7 @@ pub async fn handle_voice_listen(
         Some(s) => s,
         None => return McpToolResult::error("Error: from_sender is required"),
     };
+    let sender_lower = from_sender.to_lowercase();
     let thread_filter = args.get("thread_id").and_then(|v| v.as_str());
     let timeout_seconds = args
         .get("timeout_seconds")
@@ -602,7 +639,7 @@ pub async fn handle_voice_listen(
                     timestamp,
                 }))) => {
                     // Check sender match
-                    if from.to_lowercase() != from_sender.to_lowercase() {
+                    if from.to_lowercase() != sender_lower {
                         continue;
                     }
                     // Check thread filter
@@ -658,10 +695,14 @@ pub async fn handle_voice_listen(
                 from_sender, timeout_seconds
             ));
         }
-        // Otherwise fall through to file-based polling below
+        // Otherwise fall through to the file-based fallback below
     }
 
-    // File-based polling fallback: poll for new messages every 5 seconds
+    // File-based fallback: re-read the inbox whenever it changes on disk.
+    // The watcher is created before the first read so no write can slip
+    // between the read and the wait.
+    let mut inbox_changes = watch_inbox(data_dir);
+
     loop {
         if start.elapsed() >= timeout {
             break;
@@ -673,13 +714,16 @@ pub async fn handle_voice_listen(
             last_lock_refresh = Instant::now();
         }
 
-        // Check for new messages
+        // Check for new messages. The inbox is only ever appended to (and
+        // trimmed from the front), so unseen messages form a suffix: walk
+        // back from the newest and stop at the first one we already knew.
         let store: InboxStore = read_json_file(&path, InboxStore { messages: vec![] }).await;
 
         let new_msg = store
             .messages
             .iter()
-            .filter(|m| m.from.to_lowercase() == from_sender.to_lowercase())
+            .rev()
+            .take_while(|m| !existing_ids.contains(&m.id))
             .filter(|m| {
                 if let Some(filter) = thread_filter {
                     m.thread_id.as_deref() == Some(filter)
@@ -687,7 +731,7 @@ pub async fn handle_voice_listen(
                     true
                 }
             })
-            .rfind(|m| !existing_ids.contains(&m.id));
+            .find(|m| m.from.to_lowercase() == sender_lower);
 
         if let Some(msg) = new_msg {
             let wait_secs = start.elapsed().as_secs();
@@ -724,13 +768,25 @@ pub async fn handle_voice_listen(
             return McpToolResult::text(response);
         }
 
-        // Wait before polling again (5 seconds, similar to Node.js fallback interval)
         let remaining = timeout.saturating_sub(start.elapsed());
-        let sleep_time = remaining.min(Duration::from_secs(5));
-        if sleep_time.is_zero() {
+        if remaining.is_zero() {
             break;
         }
-        tokio::time::sleep(sleep_time).await;
+
+        match inbox_changes.as_mut() {
+            Some((_watcher, rx)) => {
+                // Wake on the next inbox write, or for the periodic lock refresh
+                let wait = remaining.min(lock_refresh_interval);
+                if let Ok(None) = tokio::time::timeout(wait, rx.recv()).await {
+                    warn!("[voice_listen] Inbox watcher closed, falling back to polling");
+                    inbox_changes = None;
+                }
+            }
+            None => {
+                // No watcher: poll every 5 seconds (same as the Node.js fallback interval)
+                tokio::time::sleep(remaining.min(Duration::from_secs(5))).await;
+            }
+        }
     }
 
     // Timeout
@@ -78,6 +78,12 @@ fn get_api_key() -> Option<String> {
 // HTTP Client
 // ============================================
 
+/// Shared HTTP client, built on first use.
+///
+/// Reusing one client keeps its connection pool (and TLS setup) across
+/// tool calls; timeouts are set per request instead.
+static HTTP_CLIENT: Lazy<reqwest::Client> = Lazy::new(reqwest::Client::new);
+
 /// Make an API request to the n8n REST API.
 async fn api_request(endpoint: &str, method: &str, body: Option<Value>) -> Result<Value, String> {
     let api_key = get_api_key()
@@ -85,10 +91,7 @@ async fn api_request(endpoint: &str, method: &str, body: Option<Value>) -> Resul
 
     let url = format!("{}/api/v1{}", N8N_API_URL, endpoint);
 
-    let client = reqwest::Client::builder()
-        .timeout(Duration::from_secs(30))
-        .build()
-        .map_err(|e| format!("Failed to create HTTP client: {}", e))?;
+    let client = &*HTTP_CLIENT;
 
     let mut req_builder = match method {
         "POST" => client.post(&url),
@@ -99,6 +102,7 @@ async fn api_request(endpoint: &str, method: &str, body: Option<Value>) -> Resul
     };
 
     req_builder = req_builder
+        .timeout(Duration::from_secs(30))
         .header("X-N8N-API-KEY", &api_key)
         .header("Content-Type", "application/json");
 
@@ -154,10 +158,7 @@ async fn raw_request(
         ));
     }
 
-    let client = reqwest::Client::builder()
-        .timeout(Duration::from_secs(timeout_secs))
-        .build()
-        .map_err(|e| format!("Failed to create HTTP client: {}", e))?;
+    let client = &*HTTP_CLIENT;
 
     let mut req_builder = match method {
         "POST" => client.post(url),
@@ -166,7 +167,9 @@ async fn raw_request(
         _ => client.get(url),
     };
 
-    req_builder = req_builder.header("Content-Type", "application/json");
+    req_builder = req_builder
+        .timeout(Duration::from_secs(timeout_secs))
+        .header("Content-Type", "application/json");
 
     if let Some(data) = body {
         req_builder = req_builder.json(&data);
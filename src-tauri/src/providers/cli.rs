@@ -15,7 +15,7 @@ use std::io::{Read, Write as IoWrite};
 use std::path::PathBuf;
 use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
 use std::sync::{Arc, Mutex};
-use std::time::Duration;
+use std::time::{Duration, Instant};
 
 use portable_pty::{native_pty_system, CommandBuilder, PtySize};
 use tokio::sync::mpsc::UnboundedSender;
@@ -23,53 +23,62 @@ use tracing::{info, warn};
 
 use super::{Provider, ProviderConfig, ProviderEvent};
 
-/// Strip ANSI escape sequences from text for clean pattern matching.
+/// The TUI counts as settled once its PTY output has been quiet this long.
+const READY_SETTLE_QUIET_MS: u64 = 400;
+
+/// Longest the ready-queue drain waits past `ready_delay_ms` for the TUI
+/// output to go quiet.
+const READY_SETTLE_MAX_EXTRA_MS: u64 = 2000;
+
+/// Strip ANSI escape sequences from text for clean pattern matching,
+/// appending the clean text to `out`.
 ///
 /// Handles CSI sequences (ESC [ ... final_byte), OSC sequences (ESC ] ... ST),
-/// and simple two-byte escapes (ESC char).
-fn strip_ansi_codes(input: &str) -> String {
-    let mut out = String::with_capacity(input.len());
-    let mut chars = input.chars().peekable();
-
-    while let Some(c) = chars.next() {
-        if c == '\x1b' {
-            match chars.peek() {
-                Some('[') => {
-                    chars.next(); // consume '['
-                    // CSI: consume until final byte (0x40..=0x7E)
-                    while let Some(&ch) = chars.peek() {
-                        chars.next();
-                        if ('@'..='~').contains(&ch) {
-                            break;
-                        }
-                    }
+/// and simple two-byte escapes (ESC char). Plain runs between escapes are
+/// copied in one piece. Returns the number of bytes consumed: an escape
+/// sequence cut off at the end of `input` is left unconsumed so the caller
+/// can retry once the rest of it has been read.
+fn strip_ansi_into(input: &str, out: &mut String) -> usize {
+    let bytes = input.as_bytes();
+    let mut pos = 0;
+
+    while let Some(offset) = bytes[pos..].iter().position(|&b| b == 0x1b) {
+        let esc = pos + offset;
+        out.push_str(&input[pos..esc]);
+        pos = match bytes.get(esc + 1) {
+            None => return esc,
+            Some(b'[') => {
+                // CSI: consume until final byte (0x40..=0x7E)
+                match bytes[esc + 2..].iter().position(|b| (0x40..=0x7e).contains(b)) {
+                    Some(i) => esc + 2 + i + 1,
+                    None => return esc,
                 }
-                Some(']') => {
-                    chars.next(); // consume ']'
-                    // OSC: consume until ST (ESC \ or BEL)
-                    while let Some(ch) = chars.next() {
-                        if ch == '\x07' {
-                            break;
-                        }
-                        if ch == '\x1b' {
-                            if chars.peek() == Some(&'\\') {
-                                chars.next();
-                            }
-                            break;
+            }
+            Some(b']') => {
+                // OSC: consume until ST (ESC \ or BEL)
+                match bytes[esc + 2..].iter().position(|&b| b == 0x07 || b == 0x1b) {
+                    Some(i) => {
+                        let term = esc + 2 + i;
+                        match (bytes[term], bytes.get(term + 1)) {
+                            (0x07, _) => term + 1,
+                            (_, Some(b'\\')) => term + 2,
+                            (_, None) => return esc,
+                            (_, Some(_)) => term + 1,
                         }
                     }
+                    None => return esc,
                 }
-                Some(_) => {
-                    chars.next(); // consume single char after ESC
-                }
-                None => {}
             }
-        } else {
-            out.push(c);
-        }
+            Some(_) => {
+                // Consume single char after ESC
+                let len = input[esc + 1..].chars().next().map_or(1, char::len_utf8);
+                esc + 1 + len
+            }
+        };
     }
 
-    out
+    out.push_str(&input[pos..]);
+    input.len()
 }
 
 /// Configuration for a specific CLI tool.
@@ -81,7 +90,9 @@ pub struct CliConfig {
     pub args: &'static [&'static str],
     /// Patterns in PTY output that indicate the TUI is ready for input.
     pub ready_patterns: &'static [&'static str],
-    /// Additional delay (ms) after detecting ready patterns before sending input.
+    /// Minimum delay (ms) after detecting ready patterns before sending input.
+    /// If the TUI is still drawing then, queued input waits (up to
+    /// `READY_SETTLE_MAX_EXTRA_MS` longer) for its output to go quiet.
     pub ready_delay_ms: u64,
     /// Human-readable display name.
     pub display_name: &'static str,
@@ -773,11 +784,20 @@ impl Provider for CliProvider {
             .iter()
             .map(|s| s.to_string())
             .collect();
+        let max_pattern_len = ready_patterns.iter().map(|p| p.len()).max().unwrap_or(0);
         let display_name = self.cli_config.display_name.to_string();
+        // Millis (relative to `session_start`) of the most recent PTY output,
+        // used to tell when the TUI has finished drawing after ready detection.
+        let session_start = Instant::now();
+        let last_output_ms = Arc::new(AtomicU64::new(0));
 
         let reader_handle = std::thread::spawn(move || {
             let mut buf = [0u8; 4096];
+            // Raw output not yet stripped (an escape sequence split across
+            // reads), the stripped text so far, and total raw bytes seen.
             let mut output_buffer = String::new();
+            let mut clean_buffer = String::new();
+            let mut raw_len = 0usize;
 
             loop {
                 // Check if generation changed (provider was stopped/restarted)
@@ -796,34 +816,68 @@ impl Provider for CliProvider {
                             break;
                         }
 
+                        last_output_ms.store(
+                            session_start.elapsed().as_millis() as u64,
+                            Ordering::Relaxed,
+                        );
+
                         let data = String::from_utf8_lossy(&buf[..n]).to_string();
                         let _ = event_tx.send(ProviderEvent::Output(data.clone()));
 
                         // Ready detection
                         if !is_ready.load(Ordering::SeqCst) {
                             output_buffer.push_str(&data);
-
-                            // Strip ANSI escape sequences for pattern matching
-                            let clean = strip_ansi_codes(&output_buffer);
-                            let has_prompt = ready_patterns.iter().any(|p| clean.contains(p))
-                                || clean.len() > 8000; // Fallback: if 8KB+ of clean output, TUI is definitely up
+                            raw_len += data.len();
+
+                            // Strip ANSI escape sequences for pattern matching.
+                            // Only the new output is stripped and searched (plus
+                            // enough overlap to catch a pattern split across reads).
+                            let mut from = clean_buffer.len().saturating_sub(max_pattern_len);
+                            let used = strip_ansi_into(&output_buffer, &mut clean_buffer);
+                            output_buffer.drain(..used);
+                            while !clean_buffer.is_char_boundary(from) {
+                                from -= 1;
+                            }
+                            let recent = &clean_buffer[from..];
+                            let has_prompt = ready_patterns.iter().any(|p| recent.contains(p.as_str()))
+                                || clean_buffer.len() > 8000; // Fallback: if 8KB+ of clean output, TUI is definitely up
 
                             if has_prompt {
                                 info!(
                                     "{} TUI ready detected (buffer {} bytes, clean {} bytes)",
-                                    display_name, output_buffer.len(), clean.len()
+                                    display_name, raw_len, clean_buffer.len()
                                 );
                                 is_ready.store(true, Ordering::SeqCst);
                                 output_buffer.clear();
+                                clean_buffer.clear();
                                 let _ = event_tx.send(ProviderEvent::Ready);
 
-                                // Drain ready queue after configured delay
+                                // Drain ready queue once the TUI settles
                                 let writer_clone = writer_for_ready.clone();
                                 let queue_clone = ready_queue.clone();
                                 let gen_check = generation.clone();
+                                let last_output = last_output_ms.clone();
                                 std::thread::spawn(move || {
-                                    // Wait for the TUI to settle
+                                    // Wait the provider's configured delay, then until
+                                    // the TUI output has been quiet for
+                                    // READY_SETTLE_QUIET_MS (capped at
+                                    // READY_SETTLE_MAX_EXTRA_MS more)
                                     std::thread::sleep(Duration::from_millis(ready_delay_ms));
+                                    let deadline = Instant::now()
+                                        + Duration::from_millis(READY_SETTLE_MAX_EXTRA_MS);
+                                    loop {
+                                        let now = Instant::now();
+                                        if now >= deadline {
+                                            break;
+                                        }
+                                        let idle_ms = (session_start.elapsed().as_millis() as u64)
+                                            .saturating_sub(last_output.load(Ordering::Relaxed));
+                                        if idle_ms >= READY_SETTLE_QUIET_MS {
+                                            break;
+                                        }
+                                        let wait = Duration::from_millis(READY_SETTLE_QUIET_MS - idle_ms);
+                                        std::thread::sleep(wait.min(deadline - now));
+                                    }
 
                                     if gen_check.load(Ordering::SeqCst) != my_gen {
                                         return;
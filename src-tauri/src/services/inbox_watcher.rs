@@ -6,7 +6,7 @@
 //!
 //! Port of `electron/services/inbox-watcher.js`.
 
-use std::collections::HashSet;
+use std::collections::{HashSet, VecDeque};
 use std::path::PathBuf;
 use std::sync::{Arc, Mutex};
 
@@ -61,31 +61,36 @@ pub struct InboxEvent {
     pub reply_to: Option<String>,
 }
 
+/// Most message IDs the watcher remembers.
+///
+/// Must exceed the number of messages inbox.json can hold (the MCP server
+/// caps it at 500): forgetting the ID of a message still in the file would
+/// re-emit it on the next change.
+const MAX_SEEN_IDS: usize = 1000;
+
 /// Shared state for the inbox watcher.
 struct WatcherState {
     /// IDs of messages we've already emitted events for.
     seen_ids: HashSet<String>,
+    /// The same IDs in the order they were seen, so the oldest is evicted first.
+    seen_order: VecDeque<String>,
+    /// Stamp of the inbox version last parsed successfully.
+    last_stamp: Option<InboxStamp>,
 }
 
 impl WatcherState {
     fn new() -> Self {
         Self {
             seen_ids: HashSet::new(),
+            seen_order: VecDeque::new(),
+            last_stamp: None,
         }
     }
 
     /// Seed seen IDs from existing messages to avoid re-emitting old ones.
     fn seed_from_messages(&mut self, messages: &[InboxMessage]) {
         for msg in messages {
-            self.seen_ids.insert(msg.id.clone());
-        }
-        // Cap at 200 entries
-        if self.seen_ids.len() > 200 {
-            let excess = self.seen_ids.len() - 200;
-            let to_remove: Vec<String> = self.seen_ids.iter().take(excess).cloned().collect();
-            for id in to_remove {
-                self.seen_ids.remove(&id);
-            }
+            self.mark_seen(msg.id.clone());
         }
     }
 
@@ -96,11 +101,14 @@ impl WatcherState {
 
     /// Mark a message ID as seen.
     fn mark_seen(&mut self, id: String) {
-        self.seen_ids.insert(id);
-        // Keep bounded
-        if self.seen_ids.len() > 200 {
-            if let Some(first) = self.seen_ids.iter().next().cloned() {
-                self.seen_ids.remove(&first);
+        if !self.seen_ids.insert(id.clone()) {
+            return;
+        }
+        self.seen_order.push_back(id);
+        // Keep bounded, forgetting the oldest IDs first
+        while self.seen_order.len() > MAX_SEEN_IDS {
+            if let Some(oldest) = self.seen_order.pop_front() {
+                self.seen_ids.remove(&oldest);
             }
         }
     }
@@ -131,15 +139,8 @@ pub fn get_inbox_path() -> PathBuf {
 
 /// Read and parse the inbox file.
 fn read_inbox(path: &std::path::Path) -> Option<InboxData> {
-    match std::fs::read_to_string(path) {
-        Ok(raw) => match serde_json::from_str::<InboxData>(&raw) {
-            Ok(data) => Some(data),
-            Err(e) => {
-                // SyntaxError is expected during atomic writes
-                debug!("Failed to parse inbox.json: {}", e);
-                None
-            }
-        },
+    match std::fs::read(path) {
+        Ok(raw) => parse_inbox(&raw),
         Err(e) => {
             if e.kind() != std::io::ErrorKind::NotFound {
                 debug!("Failed to read inbox.json: {}", e);
@@ -149,6 +150,20 @@ fn read_inbox(path: &std::path::Path) -> Option<InboxData> {
     }
 }
 
+/// Parse raw inbox.json bytes.
+fn parse_inbox(raw: &[u8]) -> Option<InboxData> {
+    // Parse straight from bytes: serde_json validates UTF-8 as it goes,
+    // so a separate String conversion pass over the whole file is wasted.
+    match serde_json::from_slice::<InboxData>(raw) {
+        Ok(data) => Some(data),
+        Err(e) => {
+            // SyntaxError is expected during atomic writes
+            debug!("Failed to parse inbox.json: {}", e);
+            None
+        }
+    }
+}
+
 /// Classify a message sender (public wrapper for use by pipe_server).
 pub fn classify_sender_pub(from: &str) -> &'static str {
     classify_sender(from)
@@ -170,10 +185,17 @@ fn process_inbox(
     state: &mut WatcherState,
     app_handle: &AppHandle,
 ) {
+    // Stamp before reading: a write landing mid-read then leaves the stamp
+    // stale, so the next check re-reads instead of missing it.
+    let stamp = settled_inbox_stamp(inbox_path);
     let data = match read_inbox(inbox_path) {
         Some(d) => d,
-        None => return,
+        None => {
+            state.last_stamp = None;
+            return;
+        }
     };
+    state.last_stamp = stamp;
 
     if data.messages.is_empty() {
         return;
@@ -235,11 +257,52 @@ impl InboxWatcherHandle {
     }
 }
 
+/// Identifies one on-disk version of inbox.json: modification time and size.
+type InboxStamp = (std::time::SystemTime, u64);
+
+/// Coarsest modification-time resolution we expect (FAT stores 2 s).
+/// Two writes this close together can leave the same mtime behind.
+const MTIME_RESOLUTION: std::time::Duration = std::time::Duration::from_secs(2);
+
+/// Stamp the inbox file as it currently is on disk.
+fn inbox_stamp(path: &std::path::Path) -> Option<InboxStamp> {
+    let meta = std::fs::metadata(path).ok()?;
+    Some((meta.modified().ok()?, meta.len()))
+}
+
+/// Stamp the inbox file, or `None` if it was modified within
+/// `MTIME_RESOLUTION` of now: a same-size rewrite in that window could keep
+/// the same mtime, so such a stamp can't prove the file is unchanged later.
+fn settled_inbox_stamp(path: &std::path::Path) -> Option<InboxStamp> {
+    let stamp = inbox_stamp(path)?;
+    let age = std::time::SystemTime::now().duration_since(stamp.0).ok()?;
+    (age >= MTIME_RESOLUTION).then_some(stamp)
+}
+
+/// Hash of raw inbox.json bytes, used to recognise our own last write.
+fn content_hash(raw: &[u8]) -> u64 {
+    use std::hash::{Hash, Hasher};
+    let mut hasher = std::collections::hash_map::DefaultHasher::new();
+    raw.hash(&mut hasher);
+    hasher.finish()
+}
+
+/// Inbox contents as of our last write, with the hash of the bytes written.
+///
+/// While the file still holds exactly those bytes, the next write appends
+/// to this copy instead of re-parsing the whole inbox. A content hash
+/// rather than an mtime stamp, since our own write is always too recent
+/// for its mtime to rule out a same-size rewrite. Holding the lock also
+/// serializes in-process read-modify-write cycles so that concurrent
+/// writers don't drop each other's messages.
+static INBOX_MIRROR: Mutex<Option<(u64, InboxData)>> = Mutex::new(None);
+
 /// Write a new message to the MCP inbox file.
 ///
 /// Used to bridge voice transcriptions to the AI provider. The AI reads
 /// inbox.json via the `voice_listen` MCP tool.
 pub fn write_inbox_message(from: &str, message: &str, thread_id: Option<&str>) -> Result<(), String> {
+    let mut mirror = INBOX_MIRROR.lock().unwrap_or_else(|e| e.into_inner());
     let inbox_path = get_inbox_path();
     let data_dir = get_mcp_data_dir();
 
@@ -247,8 +310,14 @@ pub fn write_inbox_message(from: &str, message: &str, thread_id: Option<&str>) -
     std::fs::create_dir_all(&data_dir)
         .map_err(|e| format!("Failed to create data dir: {}", e))?;
 
-    // Read existing inbox or create empty
-    let mut data = read_inbox(&inbox_path).unwrap_or_default();
+    // Reuse our last write if the file still holds it, otherwise parse the
+    // existing inbox or create empty
+    let raw = std::fs::read(&inbox_path).ok();
+    let mut data = match (mirror.take(), raw) {
+        (Some((hash, data)), Some(raw)) if content_hash(&raw) == hash => data,
+        (_, Some(raw)) => parse_inbox(&raw).unwrap_or_default(),
+        (_, None) => InboxData::default(),
+    };
 
     // Generate RFC3339-like timestamp without chrono dependency
     let timestamp = {
@@ -290,6 +359,7 @@ pub fn write_inbox_message(from: &str, message: &str, thread_id: Option<&str>) -
         .map_err(|e| format!("Failed to write inbox.tmp: {}", e))?;
     std::fs::rename(&tmp_path, &inbox_path)
         .map_err(|e| format!("Failed to rename inbox.tmp: {}", e))?;
+    *mirror = Some((content_hash(json.as_bytes()), data));
 
     info!(
         "Wrote inbox message from '{}': {}...",
@@ -317,9 +387,11 @@ pub fn start_inbox_watcher(app_handle: AppHandle) -> Result<InboxWatcherHandle,
     // Initialize state and seed with existing messages
     let state = Arc::new(Mutex::new(WatcherState::new()));
 
+    let seed_stamp = settled_inbox_stamp(&inbox_path);
     if let Some(data) = read_inbox(&inbox_path) {
         let mut s = state.lock().unwrap_or_else(|e| e.into_inner());
         s.seed_from_messages(&data.messages);
+        s.last_stamp = seed_stamp;
         info!(
             "Inbox watcher seeded with {} existing message IDs",
             s.seen_ids.len()
@@ -334,8 +406,8 @@ pub fn start_inbox_watcher(app_handle: AppHandle) -> Result<InboxWatcherHandle,
     let inbox_path_clone = inbox_path.clone();
     let app_handle_clone = app_handle.clone();
 
-    // Debounce: use a channel to coalesce rapid file change events
-    let (tx, rx) = std::sync::mpsc::channel::<()>();
+    // Coalesce rapid file change events: one pending wake-up is enough
+    let (tx, rx) = std::sync::mpsc::sync_channel::<()>(1);
 
     let watcher_result = notify::recommended_watcher(move |res: Result<Event, notify::Error>| {
         match res {
@@ -349,14 +421,16 @@ pub fn start_inbox_watcher(app_handle: AppHandle) -> Result<InboxWatcherHandle,
                     return;
                 }
 
+                // Writers go through inbox.json.tmp + rename, so only the
+                // final name carries new content worth re-reading.
                 let is_inbox = event.paths.iter().any(|p| {
                     p.file_name()
-                        .map(|f| f == "inbox.json" || f == "inbox.json.tmp")
+                        .map(|f| f == "inbox.json")
                         .unwrap_or(false)
                 });
 
                 if is_inbox {
-                    let _ = tx.send(());
+                    let _ = tx.try_send(());
                 }
             }
             Err(e) => {
@@ -372,7 +446,7 @@ pub fn start_inbox_watcher(app_handle: AppHandle) -> Result<InboxWatcherHandle,
         .watch(&data_dir, RecursiveMode::NonRecursive)
         .map_err(|e| format!("Failed to watch data dir: {}", e))?;
 
-    // Spawn debounce + processing thread
+    // Spawn processing thread
     std::thread::Builder::new()
         .name("inbox-watcher".into())
         .spawn(move || {
@@ -380,20 +454,21 @@ pub fn start_inbox_watcher(app_handle: AppHandle) -> Result<InboxWatcherHandle,
 
             loop {
                 // Wait for a file change notification (with timeout for shutdown check)
-                match rx.recv_timeout(std::time::Duration::from_secs(5)) {
+                let notified = match rx.recv_timeout(std::time::Duration::from_secs(5)) {
                     Ok(()) => {
-                        // Debounce: drain any queued notifications
-                        std::thread::sleep(std::time::Duration::from_millis(100));
-                        while rx.try_recv().is_ok() {}
+                        // Process immediately; events that arrive while we read
+                        // leave a single pending wake-up for the next pass.
+                        true
                     }
                     Err(std::sync::mpsc::RecvTimeoutError::Timeout) => {
                         // Check if we should stop
+                        false
                     }
                     Err(std::sync::mpsc::RecvTimeoutError::Disconnected) => {
                         info!("Inbox watcher channel disconnected, stopping");
                         break;
                     }
-                }
+                };
 
                 // Check running flag
                 let is_running = *running_clone
@@ -404,8 +479,13 @@ pub fn start_inbox_watcher(app_handle: AppHandle) -> Result<InboxWatcherHandle,
                     break;
                 }
 
-                // Process inbox
+                // Process inbox. The periodic wake-up is only a fallback for
+                // missed notifications, so skip the re-parse if the file is
+                // unchanged since we last read it.
                 let mut s = state_clone.lock().unwrap_or_else(|e| e.into_inner());
+                if !notified && s.last_stamp.is_some() && inbox_stamp(&inbox_path_clone) == s.last_stamp {
+                    continue;
+                }
                 process_inbox(&inbox_path_clone, &mut s, &app_handle_clone);
             }
 
@@ -442,6 +522,16 @@ mod tests {
         assert!(path.to_string_lossy().ends_with("inbox.json"));
     }
 
+    #[test]
+    fn test_fresh_inbox_stamp_not_settled() {
+        let path = std::env::temp_dir().join(format!("inbox-stamp-{}.json", std::process::id()));
+        std::fs::write(&path, b"{}").unwrap();
+        // Just written: within mtime resolution of now, so not trusted yet
+        assert!(inbox_stamp(&path).is_some());
+        assert!(settled_inbox_stamp(&path).is_none());
+        let _ = std::fs::remove_file(&path);
+    }
+
     #[test]
     fn test_classify_sender() {
         assert_eq!(classify_sender("voice-claude"), "claude_message");
@@ -493,6 +583,20 @@ mod tests {
         assert!(state.is_seen("msg-1"));
     }
 
+    #[test]
+    fn test_watcher_state_evicts_oldest() {
+        let mut state = WatcherState::new();
+        for i in 0..=MAX_SEEN_IDS {
+            state.mark_seen(format!("msg-{}", i));
+        }
+        // Re-marking a known ID must not count twice
+        state.mark_seen(format!("msg-{}", MAX_SEEN_IDS));
+        assert!(!state.is_seen("msg-0"));
+        assert!(state.is_seen("msg-1"));
+        assert!(state.is_seen(&format!("msg-{}", MAX_SEEN_IDS)));
+        assert_eq!(state.seen_ids.len(), MAX_SEEN_IDS);
+    }
+
     #[test]
     fn test_read_inbox_missing_file() {
         let result = read_inbox(std::path::Path::new("/nonexistent/inbox.json"));
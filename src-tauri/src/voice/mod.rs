@@ -148,6 +148,34 @@ impl Default for VoiceEngineConfig {
     }
 }
 
+// ── Pre-loaded TTS ──────────────────────────────────────────────────
+
+/// A TTS engine built ahead of pipeline start, tagged with the settings it
+/// was built for.
+///
+/// Filled at app startup and by `VoicePipeline::stop()`, so the pipeline
+/// can skip the cold model load. Engines bake their voice and speed in at
+/// construction, so one is only reusable under exactly the same settings.
+pub struct PreloadedTts {
+    /// TTS adapter the engine was created with.
+    pub adapter: String,
+    /// Voice the engine was created with.
+    pub voice: String,
+    /// Speed the engine was created with.
+    pub speed: f32,
+    /// The engine itself.
+    pub engine: Box<dyn tts::TtsEngine>,
+}
+
+impl PreloadedTts {
+    /// Whether this engine was built with the TTS settings in `config`.
+    pub fn matches(&self, config: &VoiceEngineConfig) -> bool {
+        self.adapter == config.tts_adapter
+            && self.voice == config.tts_voice
+            && self.speed == config.tts_speed
+    }
+}
+
 // ── Voice Engine ────────────────────────────────────────────────────
 
 /// Top-level voice engine that orchestrates all voice components.
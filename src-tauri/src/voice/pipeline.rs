@@ -16,6 +16,7 @@ use std::sync::{Arc, Mutex};
 use std::time::Duration;
 
 use cpal::traits::{DeviceTrait, HostTrait, StreamTrait};
+use futures_util::StreamExt;
 use rodio::{OutputStream, Sink};
 use serde::Serialize;
 use tauri::{AppHandle, Emitter};
@@ -36,6 +37,19 @@ const CHUNK_SAMPLES: usize = 1280;
 /// Ring buffer capacity: ~10 seconds of 16kHz mono audio.
 const RING_BUFFER_CAPACITY: usize = 160_000;
 
+/// Initial recording buffer capacity: ~30 seconds of 16kHz mono audio.
+/// The buffer is reused across utterances, so typical recordings never
+/// reallocate while audio is being appended.
+const RECORDING_BUF_CAPACITY: usize = 480_000;
+
+/// Number of phrases synthesized concurrently ahead of playback, for
+/// engines that support it (see `TtsEngine::overlaps_synthesis`).
+const TTS_SYNTH_AHEAD: usize = 3;
+
+/// Longest the processing loop waits for captured audio before re-checking
+/// whether the pipeline is still running.
+const AUDIO_WAIT_TIMEOUT_MS: u64 = 500;
+
 // ── Voice Events (emitted to frontend) ─────────────────────────────
 
 /// Events emitted by the voice pipeline to the Tauri frontend.
@@ -111,12 +125,15 @@ pub struct VoicePipeline {
 struct PipelineShared {
     /// Current voice state (atomic for lock-free reads).
     state: AtomicU8,
-    /// Current voice mode.
-    mode: std::sync::Mutex<VoiceMode>,
+    /// Current voice mode (atomic so the audio loop reads it without locking).
+    mode: AtomicU8,
     /// Whether the pipeline is running.
     running: AtomicBool,
     /// Cancellation flag for TTS playback.
     tts_cancel: AtomicBool,
+    /// Signalled whenever `tts_cancel` is set, so synthesis and playback
+    /// stop immediately instead of noticing the flag on their next check.
+    tts_cancelled: tokio::sync::Notify,
     /// Force-stop recording flag (PTT release / Toggle stop).
     /// When set, the processing loop immediately transitions Recording → Processing.
     force_stop_recording: AtomicBool,
@@ -126,12 +143,17 @@ struct PipelineShared {
     ring_producer: Mutex<Option<RingProducer>>,
     /// Audio ring buffer: consumer side (read by processing thread).
     ring_consumer: Mutex<Option<RingConsumer>>,
+    /// Signalled by the capture callback after it pushes audio, and on
+    /// shutdown, so the processing loop sleeps until there is work.
+    audio_ready: tokio::sync::Notify,
     /// Accumulated recording buffer.
     recording_buf: Mutex<Vec<f32>>,
     /// STT engine.
     stt_engine: Mutex<Option<SttAdapter>>,
     /// TTS engine for speech synthesis output.
     tts_engine: Mutex<Option<Box<dyn TtsEngine>>>,
+    /// Signalled whenever the TTS engine is put back into `tts_engine`.
+    tts_engine_returned: tokio::sync::Notify,
     /// Pipeline configuration.
     config: VoiceEngineConfig,
 }
@@ -171,29 +193,33 @@ impl RingBuffer {
         }
     }
 
+    /// Append samples, overwriting the oldest data once full.
+    ///
+    /// Copies at most two contiguous slices (before and after the wrap point)
+    /// rather than moving one sample at a time.
     fn push_slice(&mut self, samples: &[f32]) -> usize {
-        let mut written = 0;
-        for &sample in samples {
-            if self.count >= self.capacity {
-                // Overwrite oldest data
-                self.read_pos = (self.read_pos + 1) % self.capacity;
-                self.count -= 1;
-            }
-            self.data[self.write_pos] = sample;
-            self.write_pos = (self.write_pos + 1) % self.capacity;
-            self.count += 1;
-            written += 1;
-        }
-        written
+        // Only the newest `capacity` samples can survive this call
+        let skip = samples.len().saturating_sub(self.capacity);
+        let kept = &samples[skip..];
+        let start = (self.write_pos + skip) % self.capacity;
+        let first = kept.len().min(self.capacity - start);
+        self.data[start..start + first].copy_from_slice(&kept[..first]);
+        self.data[..kept.len() - first].copy_from_slice(&kept[first..]);
+
+        self.write_pos = (start + kept.len()) % self.capacity;
+        self.count = (self.count + samples.len()).min(self.capacity);
+        // Overwritten data moves the read position up behind the writer
+        self.read_pos = (self.write_pos + self.capacity - self.count) % self.capacity;
+        samples.len()
     }
 
     fn pop_slice(&mut self, buf: &mut [f32]) -> usize {
         let to_read = buf.len().min(self.count);
-        for item in buf.iter_mut().take(to_read) {
-            *item = self.data[self.read_pos];
-            self.read_pos = (self.read_pos + 1) % self.capacity;
-            self.count -= 1;
-        }
+        let first = to_read.min(self.capacity - self.read_pos);
+        buf[..first].copy_from_slice(&self.data[self.read_pos..self.read_pos + first]);
+        buf[first..to_read].copy_from_slice(&self.data[..to_read - first]);
+        self.read_pos = (self.read_pos + to_read) % self.capacity;
+        self.count -= to_read;
         to_read
     }
 
@@ -202,14 +228,13 @@ impl RingBuffer {
         self.count
     }
 
-    fn drain_all(&mut self) -> Vec<f32> {
-        let n = self.count;
-        if n == 0 {
-            return Vec::new();
-        }
-        let mut buf = vec![0.0f32; n];
-        self.pop_slice(&mut buf);
-        buf
+    /// Append every buffered sample to `out`, oldest first.
+    fn drain_into(&mut self, out: &mut Vec<f32>) {
+        let first = self.count.min(self.capacity - self.read_pos);
+        out.extend_from_slice(&self.data[self.read_pos..self.read_pos + first]);
+        out.extend_from_slice(&self.data[..self.count - first]);
+        self.read_pos = (self.read_pos + self.count) % self.capacity;
+        self.count = 0;
     }
 }
 
@@ -246,6 +271,22 @@ fn state_to_u8(s: VoiceState) -> u8 {
     }
 }
 
+fn mode_from_u8(v: u8) -> VoiceMode {
+    match v {
+        1 => VoiceMode::Toggle,
+        2 => VoiceMode::WakeWord,
+        _ => VoiceMode::PushToTalk,
+    }
+}
+
+fn mode_to_u8(m: VoiceMode) -> u8 {
+    match m {
+        VoiceMode::PushToTalk => 0,
+        VoiceMode::Toggle => 1,
+        VoiceMode::WakeWord => 2,
+    }
+}
+
 // ── Pipeline Implementation ─────────────────────────────────────────
 
 impl VoicePipeline {
@@ -271,6 +312,7 @@ impl VoicePipeline {
         ) {
             Ok(engine) => {
                 tracing::info!(adapter = %config.stt_adapter, "STT engine initialized");
+                engine.warm_up();
                 Some(engine)
             }
             Err(e) => {
@@ -287,11 +329,25 @@ impl VoicePipeline {
 
         // Initialize TTS engine — try pre-loaded first, then create a new one
         let tts_engine = {
-            // Check for pre-loaded engine from app startup
+            // Check for an engine pre-loaded at app startup or kept by stop().
+            // It is only usable if it was built with this config's settings.
             use tauri::Manager;
             let preloaded: Option<Box<dyn TtsEngine>> = app_handle
                 .try_state::<crate::PreloadedTtsState>()
-                .and_then(|state| state.lock().ok()?.take());
+                .and_then(|state| state.lock().ok()?.take())
+                .and_then(|pre| {
+                    if pre.matches(&config) {
+                        Some(pre.engine)
+                    } else {
+                        tracing::info!(
+                            adapter = %pre.adapter,
+                            voice = %pre.voice,
+                            speed = pre.speed,
+                            "Discarding pre-loaded TTS engine built for other settings"
+                        );
+                        None
+                    }
+                });
 
             match preloaded {
                 Some(engine) => {
@@ -327,16 +383,19 @@ impl VoicePipeline {
         // Build shared state
         let shared = Arc::new(PipelineShared {
             state: AtomicU8::new(state_to_u8(VoiceState::Idle)),
-            mode: std::sync::Mutex::new(config.mode),
+            mode: AtomicU8::new(mode_to_u8(config.mode)),
             running: AtomicBool::new(true),
             tts_cancel: AtomicBool::new(false),
+            tts_cancelled: tokio::sync::Notify::new(),
             force_stop_recording: AtomicBool::new(false),
             app_handle: app_handle.clone(),
             ring_producer: Mutex::new(Some(producer)),
             ring_consumer: Mutex::new(Some(consumer)),
-            recording_buf: Mutex::new(Vec::new()),
+            audio_ready: tokio::sync::Notify::new(),
+            recording_buf: Mutex::new(Vec::with_capacity(RECORDING_BUF_CAPACITY)),
             stt_engine: Mutex::new(stt_engine),
             tts_engine: Mutex::new(tts_engine),
+            tts_engine_returned: tokio::sync::Notify::new(),
             config,
         });
 
@@ -351,13 +410,7 @@ impl VoicePipeline {
 
         // Set initial state based on mode
         {
-            let mode = match shared.mode.lock() {
-                Ok(guard) => *guard,
-                Err(e) => {
-                    tracing::error!("Failed to lock mode in start(): {}", e);
-                    VoiceMode::PushToTalk
-                }
-            };
+            let mode = mode_from_u8(shared.mode.load(Ordering::Acquire));
             match mode {
                 VoiceMode::WakeWord => {
                     // Wake word mode starts listening immediately (VAD-triggered)
@@ -392,7 +445,33 @@ impl VoicePipeline {
     pub fn stop(self) {
         tracing::info!("Stopping voice pipeline");
         self.shared.running.store(false, Ordering::SeqCst);
-        self.shared.tts_cancel.store(true, Ordering::SeqCst);
+        self.shared.audio_ready.notify_one();
+        cancel_tts(&self.shared);
+
+        // Hand an idle Kokoro engine back to the pre-load slot so the next
+        // start() reuses the loaded model instead of reading it from disk
+        // again. The other adapters are cheap to rebuild.
+        if self.shared.config.tts_adapter == "kokoro" {
+            if let Some(engine) = take_tts_engine(&self.shared) {
+                use tauri::Manager;
+                if let Some(state) = self
+                    .shared
+                    .app_handle
+                    .try_state::<crate::PreloadedTtsState>()
+                {
+                    if let Ok(mut guard) = state.lock() {
+                        tracing::debug!(name = %engine.name(), "Keeping TTS engine for restart");
+                        let config = &self.shared.config;
+                        *guard = Some(super::PreloadedTts {
+                            adapter: config.tts_adapter.clone(),
+                            voice: config.tts_voice.clone(),
+                            speed: config.tts_speed,
+                            engine,
+                        });
+                    }
+                }
+            }
+        }
 
         let _ = self
             .shared
@@ -421,37 +500,29 @@ impl VoicePipeline {
     /// When switching from WakeWord → PTT/Toggle, transitions Listening → Idle.
     /// When switching from PTT/Toggle → WakeWord, transitions Idle → Listening.
     pub fn set_mode(&self, mode: VoiceMode) {
-        match self.shared.mode.lock() {
-            Ok(mut current) => {
-                let old = *current;
-                *current = mode;
-                tracing::info!(old = %old, new = %mode, "Voice mode changed");
-
-                // Update state based on new mode (only if idle or listening)
-                let current_state = state_from_u8(self.shared.state.load(Ordering::Acquire));
-                let new_state = match (current_state, mode) {
-                    (VoiceState::Listening, VoiceMode::PushToTalk | VoiceMode::Toggle) => {
-                        Some(VoiceState::Idle)
-                    }
-                    (VoiceState::Idle, VoiceMode::WakeWord) => {
-                        Some(VoiceState::Listening)
-                    }
-                    _ => None, // Don't interrupt recording/processing/speaking
-                };
-
-                if let Some(state) = new_state {
-                    self.shared.state.store(state_to_u8(state), Ordering::Release);
-                    let _ = self.shared.app_handle.emit(
-                        "voice-event",
-                        VoiceEvent::StateChange {
-                            state: state.to_string(),
-                        },
-                    );
-                }
+        let old = mode_from_u8(self.shared.mode.swap(mode_to_u8(mode), Ordering::AcqRel));
+        tracing::info!(old = %old, new = %mode, "Voice mode changed");
+
+        // Update state based on new mode (only if idle or listening)
+        let current_state = state_from_u8(self.shared.state.load(Ordering::Acquire));
+        let new_state = match (current_state, mode) {
+            (VoiceState::Listening, VoiceMode::PushToTalk | VoiceMode::Toggle) => {
+                Some(VoiceState::Idle)
             }
-            Err(e) => {
-                tracing::error!("Failed to lock mode in set_mode(): {}", e);
+            (VoiceState::Idle, VoiceMode::WakeWord) => {
+                Some(VoiceState::Listening)
             }
+            _ => None, // Don't interrupt recording/processing/speaking
+        };
+
+        if let Some(state) = new_state {
+            self.shared.state.store(state_to_u8(state), Ordering::Release);
+            let _ = self.shared.app_handle.emit(
+                "voice-event",
+                VoiceEvent::StateChange {
+                    state: state.to_string(),
+                },
+            );
         }
     }
 
@@ -468,7 +539,7 @@ impl VoicePipeline {
             VoiceState::Speaking => {
                 // Barge-in: interrupt TTS and start recording immediately
                 tracing::info!("Barge-in: interrupting TTS to start recording");
-                self.shared.tts_cancel.store(true, Ordering::SeqCst);
+                cancel_tts(&self.shared);
                 self.begin_recording();
             }
             _ => {
@@ -517,7 +588,7 @@ impl VoicePipeline {
 
     /// Interrupt TTS playback.
     pub fn stop_speaking(&self) {
-        self.shared.tts_cancel.store(true, Ordering::SeqCst);
+        cancel_tts(&self.shared);
         tracing::info!("TTS playback interrupted");
     }
 
@@ -565,8 +636,69 @@ fn start_audio_capture(shared: &Arc<PipelineShared>) -> Result<cpal::Stream, Str
         .map_err(|e| format!("Failed to get default input config: {}", e))?;
 
     let native_rate = default_config.sample_rate().0;
-    let channels = default_config.channels();
 
+    // Ask for a mono stream when the device offers one at the same rate and
+    // format, so the callback doesn't have to downmix every buffer.
+    let supports_mono = device
+        .supported_input_configs()
+        .map(|mut configs| {
+            configs.any(|c| {
+                c.channels() == 1
+                    && c.sample_format() == default_config.sample_format()
+                    && c.min_sample_rate().0 <= native_rate
+                    && native_rate <= c.max_sample_rate().0
+            })
+        })
+        .unwrap_or(false);
+    let channels = if supports_mono { 1 } else { default_config.channels() };
+
+    // Take the producer out of shared state for the capture callback
+    let producer_mutex = {
+        let mut guard = shared
+            .ring_producer
+            .lock()
+            .map_err(|e| format!("Failed to lock ring_producer: {}", e))?;
+        guard.take()
+    };
+
+    let Some(producer) = producer_mutex else {
+        return Err("Ring buffer producer already taken".into());
+    };
+
+    // Some drivers list a mono config that then fails to open or start;
+    // fall back to the device's own channel count and downmix instead.
+    let stream = match build_capture_stream(&device, native_rate, channels, &producer, shared) {
+        Ok(stream) => stream,
+        Err(e) if channels != default_config.channels() => {
+            tracing::warn!(
+                "Mono input stream failed ({}), retrying with {} channels",
+                e,
+                default_config.channels()
+            );
+            build_capture_stream(
+                &device,
+                native_rate,
+                default_config.channels(),
+                &producer,
+                shared,
+            )?
+        }
+        Err(e) => return Err(e),
+    };
+
+    tracing::info!("Audio capture started");
+    Ok(stream)
+}
+
+/// Build and start an input stream with `channels` channels at
+/// `native_rate`, downmixing and resampling into the ring buffer.
+fn build_capture_stream(
+    device: &cpal::Device,
+    native_rate: u32,
+    channels: u16,
+    producer: &RingProducer,
+    shared: &Arc<PipelineShared>,
+) -> Result<cpal::Stream, String> {
     let stream_config = cpal::StreamConfig {
         channels,
         sample_rate: cpal::SampleRate(native_rate),
@@ -584,53 +716,49 @@ fn start_audio_capture(shared: &Arc<PipelineShared>) -> Result<cpal::Stream, Str
         "Audio input config"
     );
 
-    // Take the producer out of shared state for the capture callback
-    let producer_mutex = {
-        let mut guard = shared
-            .ring_producer
-            .lock()
-            .map_err(|e| format!("Failed to lock ring_producer: {}", e))?;
-        guard.take()
-    };
-
-    let Some(producer) = producer_mutex else {
-        return Err("Ring buffer producer already taken".into());
-    };
-
-    // Wrap producer in Arc<Mutex> for the callback (cpal callbacks need Send)
-    let producer = Arc::new(Mutex::new(producer));
+    // The callback owns its handle to the ring buffer, so the realtime
+    // audio thread only ever takes the ring buffer's own lock.
+    let ring = Arc::clone(&producer.buffer);
     let mut chunk_buf: Vec<f32> = Vec::with_capacity(CHUNK_SAMPLES * 2);
+    // Downmix scratch, reused across callbacks so the audio thread doesn't
+    // allocate once it has grown to the device's buffer size.
+    let mut mono_buf: Vec<f32> = Vec::new();
+    let notify_shared = Arc::clone(shared);
 
     let stream = device
         .build_input_stream(
             &stream_config,
             move |data: &[f32], _info: &cpal::InputCallbackInfo| {
                 // Downmix to mono if needed
-                let mono = if needs_downmix {
+                let mono: &[f32] = if needs_downmix {
                     let ch = channels as usize;
-                    data.chunks_exact(ch)
-                        .map(|frame| frame.iter().sum::<f32>() / ch as f32)
-                        .collect::<Vec<f32>>()
+                    mono_buf.clear();
+                    mono_buf.extend(
+                        data.chunks_exact(ch)
+                            .map(|frame| frame.iter().sum::<f32>() / ch as f32),
+                    );
+                    &mono_buf
                 } else {
-                    data.to_vec()
+                    data
                 };
 
-                // Resample to 16kHz if needed
-                let resampled = if needs_resample {
-                    resample_linear(&mono, native_rate, TARGET_SAMPLE_RATE)
+                // Resample to 16kHz if needed, appending straight onto the
+                // staging buffer
+                if needs_resample {
+                    resample_linear_into(mono, native_rate, TARGET_SAMPLE_RATE, &mut chunk_buf);
                 } else {
-                    mono
-                };
+                    chunk_buf.extend_from_slice(mono);
+                }
 
-                // Accumulate and push full chunks
-                chunk_buf.extend_from_slice(&resampled);
-                while chunk_buf.len() >= CHUNK_SAMPLES {
-                    let chunk: Vec<f32> = chunk_buf.drain(..CHUNK_SAMPLES).collect();
-                    if let Ok(prod) = producer.lock() {
-                        if let Ok(mut ring) = prod.buffer.lock() {
-                            ring.push_slice(&chunk);
-                        }
+                // Push all full chunks straight from the staging buffer,
+                // keeping only the partial tail for next time
+                let full = chunk_buf.len() - chunk_buf.len() % CHUNK_SAMPLES;
+                if full > 0 {
+                    if let Ok(mut ring) = ring.lock() {
+                        ring.push_slice(&chunk_buf[..full]);
                     }
+                    chunk_buf.drain(..full);
+                    notify_shared.audio_ready.notify_one();
                 }
             },
             move |err| {
@@ -644,18 +772,18 @@ fn start_audio_capture(shared: &Arc<PipelineShared>) -> Result<cpal::Stream, Str
         .play()
         .map_err(|e| format!("Failed to start input stream: {}", e))?;
 
-    tracing::info!("Audio capture started");
     Ok(stream)
 }
 
-/// Simple linear resampler from one rate to another.
-fn resample_linear(input: &[f32], from_rate: u32, to_rate: u32) -> Vec<f32> {
+/// Simple linear resampler from one rate to another, appending to `output`.
+fn resample_linear_into(input: &[f32], from_rate: u32, to_rate: u32, output: &mut Vec<f32>) {
     if from_rate == to_rate {
-        return input.to_vec();
+        output.extend_from_slice(input);
+        return;
     }
     let ratio = from_rate as f64 / to_rate as f64;
     let out_len = ((input.len() as f64) / ratio).floor() as usize;
-    let mut output = Vec::with_capacity(out_len);
+    output.reserve(out_len);
     for i in 0..out_len {
         let src_idx = i as f64 * ratio;
         let idx0 = src_idx.floor() as usize;
@@ -664,7 +792,6 @@ fn resample_linear(input: &[f32], from_rate: u32, to_rate: u32) -> Vec<f32> {
         let s1 = input.get(idx0 + 1).copied().unwrap_or(s0);
         output.push(s0 + frac * (s1 - s0));
     }
-    output
 }
 
 // ── Audio Processing Loop ───────────────────────────────────────────
@@ -680,9 +807,19 @@ async fn audio_processing_loop(shared: Arc<PipelineShared>) {
 
     tracing::info!("Audio processing loop started");
 
+    // Whether the last read came back empty; only then wait for the capture
+    // callback, so a backlog of several chunks is drained without waiting.
+    let mut idle = true;
+
     while shared.running.load(Ordering::Relaxed) {
-        // Sleep to avoid busy-waiting (40ms = roughly 2 chunks at 80ms each)
-        tokio::time::sleep(Duration::from_millis(40)).await;
+        if idle {
+            // The timeout only guards against a stalled capture stream
+            let _ = tokio::time::timeout(
+                Duration::from_millis(AUDIO_WAIT_TIMEOUT_MS),
+                shared.audio_ready.notified(),
+            )
+            .await;
+        }
 
         // Read from ring buffer
         let samples_read = {
@@ -690,6 +827,7 @@ async fn audio_processing_loop(shared: Arc<PipelineShared>) {
                 Ok(g) => g,
                 Err(e) => {
                     tracing::error!("Failed to lock ring_consumer: {}", e);
+                    idle = true;
                     continue;
                 }
             };
@@ -704,7 +842,8 @@ async fn audio_processing_loop(shared: Arc<PipelineShared>) {
             }
         };
 
-        if samples_read == 0 {
+        idle = samples_read == 0;
+        if idle {
             continue;
         }
 
@@ -713,19 +852,17 @@ async fn audio_processing_loop(shared: Arc<PipelineShared>) {
 
         match current_state {
             VoiceState::Listening => {
-                // In listening mode, run VAD to detect speech onset.
-                // TODO: For wake-word mode, also run a wake word detector here.
-                // Currently wake word mode uses VAD-triggered recording.
-                let is_speech = vad.process_frame(chunk);
+                // Only wake-word mode starts recording on its own; PTT and
+                // toggle wait for the user, so there is nothing to detect.
+                let mode = mode_from_u8(shared.mode.load(Ordering::Acquire));
+                if mode != VoiceMode::WakeWord {
+                    continue;
+                }
 
-                let mode = match shared.mode.lock() {
-                    Ok(g) => *g,
-                    Err(e) => {
-                        tracing::error!("Failed to lock mode: {}", e);
-                        VoiceMode::PushToTalk
-                    }
-                };
-                if is_speech && mode == VoiceMode::WakeWord {
+                // Run VAD to detect speech onset.
+                // TODO: Also run a wake word detector here.
+                // Currently wake word mode uses VAD-triggered recording.
+                if vad.process_frame(chunk) {
                     // Auto-start recording on speech detection (wake word / VAD mode)
                     shared
                         .state
@@ -786,51 +923,46 @@ async fn audio_processing_loop(shared: Arc<PipelineShared>) {
                         },
                     );
 
-                    // Drain remaining audio from ring buffer.
-                    // The lock result must be fully resolved (not held) before
-                    // any .await, because MutexGuard is !Send.
-                    let drain_result: Result<Vec<f32>, String> = shared
-                        .ring_consumer
-                        .lock()
-                        .map(|guard| {
-                            if let Some(ref consumer) = *guard {
-                                if let Ok(mut ring) = consumer.buffer.lock() {
-                                    ring.drain_all()
-                                } else {
-                                    Vec::new()
-                                }
-                            } else {
-                                Vec::new()
-                            }
-                        })
-                        .map_err(|e| format!("{}", e));
-
-                    let remaining = match drain_result {
-                        Ok(v) => v,
-                        Err(e) => {
-                            tracing::error!("Failed to lock ring_consumer for drain: {}", e);
-                            Vec::new()
-                        }
-                    };
-
+                    // Drain remaining audio from the ring buffer straight
+                    // into the recording buffer, then take the recording out.
+                    // The locks must be fully released before any .await,
+                    // because MutexGuard is !Send.
                     let audio_for_stt = match shared.recording_buf.lock() {
                         Ok(mut buf) => {
-                            buf.extend_from_slice(&remaining);
+                            match shared.ring_consumer.lock() {
+                                Ok(guard) => {
+                                    if let Some(ref consumer) = *guard {
+                                        if let Ok(mut ring) = consumer.buffer.lock() {
+                                            ring.drain_into(&mut buf);
+                                        }
+                                    }
+                                }
+                                Err(e) => {
+                                    tracing::error!("Failed to lock ring_consumer for drain: {}", e);
+                                }
+                            }
                             std::mem::take(&mut *buf)
                         }
                         Err(e) => {
                             tracing::error!("Failed to lock recording_buf for STT: {}", e);
-                            remaining
+                            Vec::new()
                         }
                     };
 
-                    // Run STT
-                    run_stt_and_emit(&shared, audio_for_stt).await;
+                    // Run STT, then hand the buffer back (cleared) so the
+                    // next recording reuses its allocation.
+                    let mut spent = run_stt_and_emit(&shared, audio_for_stt).await;
+                    spent.clear();
+                    if let Ok(mut buf) = shared.recording_buf.lock() {
+                        if buf.is_empty() && buf.capacity() < spent.capacity() {
+                            *buf = spent;
+                        }
+                    }
 
                     // Return to appropriate state based on mode:
                     // - WakeWord → Listening (auto-detect next utterance)
                     // - PTT / Toggle → Idle (wait for next key press)
-                    let mode = shared.mode.lock().map(|g| *g).unwrap_or(VoiceMode::PushToTalk);
+                    let mode = mode_from_u8(shared.mode.load(Ordering::Acquire));
                     let next_state = match mode {
                         VoiceMode::WakeWord => VoiceState::Listening,
                         VoiceMode::PushToTalk | VoiceMode::Toggle => VoiceState::Idle,
@@ -860,9 +992,11 @@ async fn audio_processing_loop(shared: Arc<PipelineShared>) {
 }
 
 /// Run STT on recorded audio and emit the transcription as a Tauri event.
-async fn run_stt_and_emit(shared: &Arc<PipelineShared>, audio: Vec<f32>) {
+///
+/// Returns the audio buffer so the caller can reuse its allocation.
+async fn run_stt_and_emit(shared: &Arc<PipelineShared>, audio: Vec<f32>) -> Vec<f32> {
     if audio.is_empty() {
-        return;
+        return audio;
     }
 
     let duration_secs = audio.len() as f64 / 16000.0;
@@ -884,7 +1018,7 @@ async fn run_stt_and_emit(shared: &Arc<PipelineShared>, audio: Vec<f32>) {
                         message: format!("STT engine lock poisoned: {}", e),
                     },
                 );
-                return;
+                return audio;
             }
         }
     };
@@ -896,18 +1030,18 @@ async fn run_stt_and_emit(shared: &Arc<PipelineShared>, audio: Vec<f32>) {
                 message: "No STT engine available".into(),
             },
         );
-        return;
+        return audio;
     };
 
     // Run transcription (this is CPU-bound, use spawn_blocking)
     let transcription = tokio::task::spawn_blocking(move || {
         let result = engine.transcribe(&audio);
-        (engine, result)
+        (engine, result, audio)
     })
     .await;
 
     match transcription {
-        Ok((engine, Ok(text))) => {
+        Ok((engine, Ok(text), audio)) => {
             let text = text.trim().to_string();
 
             // Put engine back
@@ -928,8 +1062,9 @@ async fn run_stt_and_emit(shared: &Arc<PipelineShared>, audio: Vec<f32>) {
                     VoiceEvent::Transcription { text },
                 );
             }
+            audio
         }
-        Ok((engine, Err(e))) => {
+        Ok((engine, Err(e), audio)) => {
             tracing::error!("STT transcription failed: {}", e);
             // Put engine back
             match shared.stt_engine.lock() {
@@ -946,6 +1081,7 @@ async fn run_stt_and_emit(shared: &Arc<PipelineShared>, audio: Vec<f32>) {
                     message: format!("STT failed: {}", e),
                 },
             );
+            audio
         }
         Err(e) => {
             tracing::error!("STT task panicked: {}", e);
@@ -955,6 +1091,7 @@ async fn run_stt_and_emit(shared: &Arc<PipelineShared>, audio: Vec<f32>) {
                     message: format!("STT task failed: {}", e),
                 },
             );
+            Vec::new()
         }
     }
 }
@@ -997,7 +1134,8 @@ fn take_tts_engine(shared: &Arc<PipelineShared>) -> Option<Box<dyn TtsEngine>> {
 /// audio chunks to a rodio Sink via an async channel. First audio plays
 /// within ~400ms instead of waiting for full synthesis.
 ///
-/// Falls back to single-shot synthesis for short text (1 phrase).
+/// Short text (a single phrase) takes the same path: the playback thread
+/// opens the output device while the phrase is still being synthesized.
 async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<(), String> {
     if text.trim().is_empty() {
         return Ok(());
@@ -1008,13 +1146,17 @@ async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<(), String> {
     let current = state_from_u8(shared.state.load(Ordering::Acquire));
     if current == VoiceState::Speaking {
         tracing::info!("Cancelling previous TTS for new speech request");
-        shared.tts_cancel.store(true, Ordering::SeqCst);
-        // Wait up to 1 second for the engine to be returned
-        for _ in 0..20 {
-            tokio::time::sleep(Duration::from_millis(50)).await;
-            if shared.tts_engine.lock().map(|g| g.is_some()).unwrap_or(false) {
-                break;
+        cancel_tts(shared);
+        // Wait up to 1 second for the engine to be returned. Woken as soon
+        // as restore_tts_engine() runs instead of polling on a fixed tick.
+        let returned = tokio::time::timeout(Duration::from_secs(1), async {
+            while !shared.tts_engine.lock().map(|g| g.is_some()).unwrap_or(false) {
+                shared.tts_engine_returned.notified().await;
             }
+        })
+        .await;
+        if returned.is_err() {
+            tracing::warn!("Previous TTS did not release the engine within 1s");
         }
     }
 
@@ -1052,8 +1194,9 @@ async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<(), String> {
     let volume = shared.config.tts_volume;
     let output_device = shared.config.output_device.clone();
 
-    // Split into phrases for streaming
-    let phrases = tts::split_into_phrases(text);
+    // Drop markdown syntax so it isn't read aloud, then split into phrases
+    let spoken = tts::strip_markdown(text);
+    let phrases = tts::split_into_phrases(&spoken);
 
     if phrases.is_empty() {
         restore_tts_engine(shared, engine);
@@ -1061,13 +1204,6 @@ async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<(), String> {
         return Ok(());
     }
 
-    // For single phrase, use simpler non-streaming path (less overhead)
-    if phrases.len() <= 1 {
-        let result = speak_oneshot(shared, engine, &phrases[0], sample_rate, volume, output_device).await;
-        finish_speaking(shared);
-        return result;
-    }
-
     // Streaming: synthesize phrase by phrase, queue in rodio Sink
     tracing::info!(
         phrases = phrases.len(),
@@ -1086,17 +1222,36 @@ async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<(), String> {
             volume,
             output_device.as_deref(),
             &shared_for_playback.tts_cancel,
+            &shared_for_playback.tts_cancelled,
         )
     });
 
-    // Synthesize phrases and send to playback
-    for (i, phrase) in phrases.iter().enumerate() {
-        if shared.tts_cancel.load(Ordering::SeqCst) {
+    // Network engines synthesize up to TTS_SYNTH_AHEAD phrases concurrently,
+    // yielding results in phrase order, so a slow round trip overlaps
+    // playback of earlier phrases. Local engines render one at a time.
+    let synth_ahead = if engine.overlaps_synthesis() { TTS_SYNTH_AHEAD } else { 1 };
+    let mut produced_audio = false;
+    let mut last_error = None;
+    let mut synthesized = futures_util::stream::iter(phrases.iter())
+        .map(|phrase| engine.synthesize(phrase))
+        .buffered(synth_ahead)
+        .enumerate();
+    loop {
+        let next = unless_cancelled(
+            synthesized.next(),
+            &shared.tts_cancel,
+            &shared.tts_cancelled,
+        )
+        .await;
+        let Some(next) = next else {
             tracing::info!("TTS cancelled during streaming synthesis");
             break;
-        }
+        };
+        let Some((i, result)) = next else {
+            break;
+        };
 
-        match engine.synthesize(phrase).await {
+        match result {
             Ok(samples) if !samples.is_empty() => {
                 tracing::debug!(
                     phrase = i + 1,
@@ -1104,6 +1259,7 @@ async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<(), String> {
                     duration_secs = format!("{:.2}", samples.len() as f64 / sample_rate as f64),
                     "Phrase synthesized"
                 );
+                produced_audio = true;
                 if chunk_tx.send(samples).await.is_err() {
                     tracing::warn!("Playback channel closed, stopping synthesis");
                     break;
@@ -1115,9 +1271,23 @@ async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<(), String> {
             Err(e) => {
                 tracing::warn!(phrase = i + 1, error = %e, "Phrase synthesis failed, skipping");
                 // Continue with remaining phrases
+                last_error = Some(e);
             }
         }
     }
+    // Drop any in-flight syntheses before the engine is handed back
+    drop(synthesized);
+
+    // Surface the failure if nothing at all could be synthesized
+    if let (false, Some(e)) = (produced_audio, last_error) {
+        tracing::error!("TTS synthesis failed: {}", e);
+        let _ = shared.app_handle.emit(
+            "voice-event",
+            VoiceEvent::Error {
+                message: format!("TTS synthesis failed: {}", e),
+            },
+        );
+    }
 
     // Drop sender to signal playback thread that no more chunks are coming
     drop(chunk_tx);
@@ -1147,79 +1317,31 @@ async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<(), String> {
     Ok(())
 }
 
-/// Single-shot (non-streaming) synthesis + playback for short text.
-async fn speak_oneshot(
-    shared: &Arc<PipelineShared>,
-    engine: Box<dyn TtsEngine>,
-    text: &str,
-    sample_rate: u32,
-    volume: f32,
-    output_device: Option<String>,
-) -> Result<(), String> {
-    let synthesize_result = engine.synthesize(text).await;
-
-    match synthesize_result {
-        Ok(samples) => {
-            if samples.is_empty() {
-                tracing::debug!("TTS produced no audio samples");
-                restore_tts_engine(shared, engine);
-                return Ok(());
-            }
-
-            tracing::info!(
-                samples = samples.len(),
-                sample_rate,
-                duration_secs = format!("{:.2}", samples.len() as f64 / sample_rate as f64),
-                "TTS synthesis complete, starting playback"
-            );
-
-            if shared.tts_cancel.load(Ordering::SeqCst) {
-                tracing::info!("TTS cancelled after synthesis");
-                restore_tts_engine(shared, engine);
-                return Ok(());
-            }
-
-            let shared_for_playback = Arc::clone(shared);
-            let playback_result = tokio::task::spawn_blocking(move || {
-                play_samples_rodio(
-                    samples,
-                    sample_rate,
-                    volume,
-                    output_device.as_deref(),
-                    &shared_for_playback.tts_cancel,
-                )
-            })
-            .await;
-
-            restore_tts_engine(shared, engine);
+/// Cancel any in-progress TTS synthesis and playback.
+fn cancel_tts(shared: &PipelineShared) {
+    shared.tts_cancel.store(true, Ordering::SeqCst);
+    shared.tts_cancelled.notify_waiters();
+}
 
-            match playback_result {
-                Ok(Ok(())) => tracing::info!("TTS playback complete"),
-                Ok(Err(e)) => {
-                    tracing::error!("TTS playback error: {}", e);
-                    let _ = shared.app_handle.emit(
-                        "voice-event",
-                        VoiceEvent::Error {
-                            message: format!("TTS playback error: {}", e),
-                        },
-                    );
-                }
-                Err(e) => tracing::error!("TTS playback task panicked: {}", e),
-            }
-        }
-        Err(e) => {
-            tracing::error!("TTS synthesis failed: {}", e);
-            restore_tts_engine(shared, engine);
-            let _ = shared.app_handle.emit(
-                "voice-event",
-                VoiceEvent::Error {
-                    message: format!("TTS synthesis failed: {}", e),
-                },
-            );
-        }
+/// Await `fut`, or return `None` as soon as TTS is cancelled.
+///
+/// The waiter is registered before the flag is checked, so a cancel that
+/// lands in between still wakes it.
+async fn unless_cancelled<F: std::future::Future>(
+    fut: F,
+    cancel: &AtomicBool,
+    cancelled: &tokio::sync::Notify,
+) -> Option<F::Output> {
+    let notified = cancelled.notified();
+    tokio::pin!(notified);
+    notified.as_mut().enable();
+    if cancel.load(Ordering::SeqCst) {
+        return None;
+    }
+    tokio::select! {
+        out = fut => Some(out),
+        _ = notified => None,
     }
-
-    Ok(())
 }
 
 /// Restore the TTS engine into shared state after use.
@@ -1230,8 +1352,12 @@ fn restore_tts_engine(shared: &Arc<PipelineShared>, engine: Box<dyn TtsEngine>)
         }
         Err(e) => {
             tracing::error!("Failed to lock tts_engine to restore: {}", e);
+            return;
         }
     }
+    // notify_one stores a permit, so a waiter that checks just before this
+    // store still wakes up.
+    shared.tts_engine_returned.notify_one();
 }
 
 /// Transition the pipeline out of Speaking state.
@@ -1243,7 +1369,7 @@ fn restore_tts_engine(shared: &Arc<PipelineShared>, engine: Box<dyn TtsEngine>)
 /// WakeWord → Listening (resume auto-detection).
 /// PTT / Toggle → Idle (wait for key press).
 fn finish_speaking(shared: &Arc<PipelineShared>) {
-    let mode = shared.mode.lock().map(|g| *g).unwrap_or(VoiceMode::PushToTalk);
+    let mode = mode_from_u8(shared.mode.load(Ordering::Acquire));
     let next_state = match mode {
         VoiceMode::WakeWord => VoiceState::Listening,
         VoiceMode::PushToTalk | VoiceMode::Toggle => VoiceState::Idle,
@@ -1307,46 +1433,6 @@ fn open_output_stream(
     }
 }
 
-/// Play f32 PCM samples through the audio output device using rodio.
-///
-/// This runs on a blocking thread. It creates a rodio `OutputStream` and
-/// `Sink`, loads the samples as a buffer source, and blocks until playback
-/// finishes or cancellation is requested.
-fn play_samples_rodio(
-    samples: Vec<f32>,
-    sample_rate: u32,
-    volume: f32,
-    output_device_name: Option<&str>,
-    cancel: &AtomicBool,
-) -> Result<(), String> {
-    let (_stream, stream_handle) = open_output_stream(output_device_name)?;
-
-    let sink = Sink::try_new(&stream_handle)
-        .map_err(|e| format!("Failed to create audio sink: {}", e))?;
-
-    // Set volume (rodio volume: 1.0 = normal)
-    sink.set_volume(volume.clamp(0.0, 2.0));
-
-    // Create a rodio source from the f32 samples (mono, engine sample rate)
-    let source = rodio::buffer::SamplesBuffer::new(1, sample_rate, samples);
-    sink.append(source);
-
-    // Poll for completion or cancellation
-    while !sink.empty() {
-        if cancel.load(Ordering::SeqCst) {
-            tracing::info!("TTS playback cancelled");
-            sink.stop();
-            return Ok(());
-        }
-        std::thread::sleep(Duration::from_millis(50));
-    }
-
-    // Wait for any remaining buffered audio
-    sink.sleep_until_end();
-
-    Ok(())
-}
-
 /// Play audio chunks received from an async channel via rodio Sink.
 ///
 /// This runs on a blocking thread. It receives synthesized audio chunks
@@ -1358,6 +1444,7 @@ fn play_chunks_rodio(
     volume: f32,
     output_device_name: Option<&str>,
     cancel: &AtomicBool,
+    cancelled: &tokio::sync::Notify,
 ) -> Result<(), String> {
     let (_stream, stream_handle) = open_output_stream(output_device_name)?;
 
@@ -1372,34 +1459,39 @@ fn play_chunks_rodio(
 
     // Receive and play chunks as they arrive
     loop {
-        if cancel.load(Ordering::SeqCst) {
-            tracing::info!("Streaming TTS playback cancelled");
-            sink.stop();
-            return Ok(());
-        }
-
-        match rt.block_on(rx.recv()) {
-            Some(samples) => {
+        match rt.block_on(unless_cancelled(rx.recv(), cancel, cancelled)) {
+            None => {
+                tracing::info!("Streaming TTS playback cancelled");
+                sink.stop();
+                return Ok(());
+            }
+            Some(Some(samples)) => {
                 let source = rodio::buffer::SamplesBuffer::new(1, sample_rate, samples);
                 sink.append(source);
             }
-            None => {
+            Some(None) => {
                 // Channel closed — all chunks sent, wait for playback to finish
                 break;
             }
         }
     }
 
-    // Wait for all queued audio to finish playing
-    while !sink.empty() {
-        if cancel.load(Ordering::SeqCst) {
-            tracing::info!("Streaming TTS playback cancelled during drain");
-            sink.stop();
-            return Ok(());
-        }
-        std::thread::sleep(Duration::from_millis(50));
+    // Queue a marker behind the last chunk: rodio runs its callback the
+    // moment playback reaches it, so the end of speech is signalled rather
+    // than discovered by polling.
+    let done = Arc::new(tokio::sync::Notify::new());
+    let done_signal = Arc::clone(&done);
+    sink.append(rodio::source::EmptyCallback::<f32>::new(Box::new(
+        move || done_signal.notify_one(),
+    )));
+
+    if rt
+        .block_on(unless_cancelled(done.notified(), cancel, cancelled))
+        .is_none()
+    {
+        tracing::info!("Streaming TTS playback cancelled during drain");
+        sink.stop();
     }
-    sink.sleep_until_end();
 
     Ok(())
 }
@@ -1469,30 +1561,69 @@ mod tests {
         assert_eq!(rb.available(), 4);
 
         // Should have the last 4 samples (overflow drops oldest)
-        let all = rb.drain_all();
+        let mut all = Vec::new();
+        rb.drain_into(&mut all);
         assert_eq!(all, vec![3.0, 4.0, 5.0, 6.0]);
     }
 
     #[test]
-    fn test_ring_buffer_drain_all() {
+    fn test_ring_buffer_drain_into() {
         let mut rb = RingBuffer::new(100);
         rb.push_slice(&[1.0, 2.0, 3.0, 4.0]);
-        let all = rb.drain_all();
-        assert_eq!(all, vec![1.0, 2.0, 3.0, 4.0]);
+        let mut all = vec![0.5];
+        rb.drain_into(&mut all);
+        assert_eq!(all, vec![0.5, 1.0, 2.0, 3.0, 4.0]);
+        assert_eq!(rb.available(), 0);
+    }
+
+    #[test]
+    fn test_ring_buffer_wrap_and_overflow() {
+        let mut rb = RingBuffer::new(5);
+        rb.push_slice(&[1.0, 2.0, 3.0, 4.0]);
+        let mut buf = [0.0f32; 3];
+        assert_eq!(rb.pop_slice(&mut buf), 3);
+
+        // Wraps past the end, then a push longer than the capacity keeps
+        // only the newest samples
+        rb.push_slice(&[5.0, 6.0, 7.0]);
+        let mut buf = [0.0f32; 4];
+        assert_eq!(rb.pop_slice(&mut buf), 4);
+        assert_eq!(buf, [4.0, 5.0, 6.0, 7.0]);
+
+        rb.push_slice(&[8.0, 9.0]);
+        rb.push_slice(&[10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0]);
+        assert_eq!(rb.available(), 5);
+        let mut all = Vec::new();
+        rb.drain_into(&mut all);
+        assert_eq!(all, vec![12.0, 13.0, 14.0, 15.0, 16.0]);
+    }
+
+    #[test]
+    fn test_ring_buffer_drain_into_wrapped() {
+        let mut rb = RingBuffer::new(4);
+        rb.push_slice(&[1.0, 2.0, 3.0]);
+        let mut buf = [0.0f32; 2];
+        rb.pop_slice(&mut buf);
+        rb.push_slice(&[4.0, 5.0, 6.0]);
+        let mut all = Vec::new();
+        rb.drain_into(&mut all);
+        assert_eq!(all, vec![3.0, 4.0, 5.0, 6.0]);
         assert_eq!(rb.available(), 0);
     }
 
     #[test]
     fn test_ring_buffer_empty_drain() {
         let mut rb = RingBuffer::new(100);
-        let all = rb.drain_all();
+        let mut all = Vec::new();
+        rb.drain_into(&mut all);
         assert!(all.is_empty());
     }
 
     #[test]
     fn test_resample_same_rate() {
         let input = vec![1.0, 2.0, 3.0];
-        let output = resample_linear(&input, 16000, 16000);
+        let mut output = Vec::new();
+        resample_linear_into(&input, 16000, 16000, &mut output);
         assert_eq!(output, input);
     }
 
@@ -1500,9 +1631,11 @@ mod tests {
     fn test_resample_downsample() {
         // 48kHz -> 16kHz = 3:1 ratio
         let input: Vec<f32> = (0..48).map(|i| i as f32).collect();
-        let output = resample_linear(&input, 48000, 16000);
-        // Should get ~16 samples from 48
-        assert_eq!(output.len(), 16);
+        let mut output = vec![-1.0];
+        resample_linear_into(&input, 48000, 16000, &mut output);
+        // Should get ~16 samples from 48, appended after existing content
+        assert_eq!(output.len(), 17);
+        assert_eq!(output[..3], [-1.0, 0.0, 3.0]);
     }
 
     #[test]
@@ -1520,6 +1653,13 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_mode_roundtrip() {
+        for mode in [VoiceMode::PushToTalk, VoiceMode::Toggle, VoiceMode::WakeWord] {
+            assert_eq!(mode_from_u8(mode_to_u8(mode)), mode);
+        }
+    }
+
     #[test]
     fn test_list_input_devices() {
         // This just tests that the function doesn't panic.
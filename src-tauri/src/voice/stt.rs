@@ -90,6 +90,12 @@ impl std::error::Error for SttError {}
 /// # Returns
 /// The path to the model file.
 pub async fn ensure_model_exists(data_dir: &Path, model_size: &str) -> Result<PathBuf, SttError> {
+    let quantized_path = quantized_model_path(data_dir, model_size);
+    if quantized_path.exists() {
+        tracing::info!(path = %quantized_path.display(), "Quantized whisper model present");
+        return Ok(quantized_path);
+    }
+
     let model_filename = format!("ggml-{}.en.bin", model_size);
     let models_dir = data_dir.join("models");
     let model_path = models_dir.join(&model_filename);
@@ -261,7 +267,7 @@ mod whisper_real {
                 "WhisperStt loaded (real whisper-rs)"
             );
 
-            Ok(Self {
+            let engine = Self {
                 inner: Arc::new(Mutex::new(WhisperInner {
                     ctx,
                     cached_state: None,
@@ -270,19 +276,118 @@ mod whisper_real {
                 model_size,
                 ready: AtomicBool::new(true),
                 streaming_buffer: Mutex::new(Vec::new()),
-            })
+            };
+            Ok(engine)
+        }
+
+        /// Run one inference on silence on a background thread so the first
+        /// real utterance doesn't pay for state allocation, weight paging and
+        /// thread-pool spin-up.
+        ///
+        /// Returns immediately. A transcription that arrives meanwhile waits
+        /// on the context lock. Failures are logged and otherwise ignored --
+        /// the state is still created lazily on the first transcription.
+        pub fn warm_up(&self) {
+            let inner = Arc::clone(&self.inner);
+            let n_threads = self.n_threads;
+            let spawned = std::thread::Builder::new()
+                .name("whisper-warmup".into())
+                .spawn(move || {
+                    let start = std::time::Instant::now();
+                    match run_inference(&inner, n_threads, &[0.0f32; MIN_SAMPLES]) {
+                        Ok(_) => tracing::info!(
+                            elapsed_ms = start.elapsed().as_millis() as u64,
+                            "Whisper warm-up complete"
+                        ),
+                        Err(e) => tracing::warn!("Whisper warm-up failed: {}", e),
+                    }
+                });
+            if let Err(e) = spawned {
+                tracing::warn!("Failed to spawn whisper warm-up thread: {}", e);
+            }
         }
 
         /// Create from a model size name, resolving the path in the data directory.
         ///
-        /// Standard model paths: `{data_dir}/models/ggml-{size}.en.bin`
+        /// Standard model paths: `{data_dir}/models/ggml-{size}.en.bin`, or the
+        /// int8 `ggml-{size}.en-q8_0.bin` when present (see `model_path_for_size`).
         pub fn from_model_size(data_dir: &Path, size: &str) -> Result<Self, SttError> {
-            let model_file = format!("ggml-{}.en.bin", size);
-            let model_path = data_dir.join("models").join(model_file);
-            Self::new(&model_path)
+            Self::new(&model_path_for_size(data_dir, size))
         }
     }
 
+    /// Run greedy English inference on `audio` using the shared context,
+    /// creating the cached `WhisperState` on first use.
+    fn run_inference(
+        inner: &Mutex<WhisperInner>,
+        n_threads: i32,
+        audio: &[f32],
+    ) -> Result<String, SttError> {
+        let mut guard = inner.lock().map_err(|e| {
+            SttError::TranscriptionError(format!("Failed to lock whisper context: {}", e))
+        })?;
+
+        // Lazily create or reuse the cached WhisperState
+        let state = match guard.cached_state.as_mut() {
+            Some(s) => s,
+            None => {
+                tracing::info!("Creating whisper state (first transcription)");
+                let s = guard.ctx.create_state().map_err(|e| {
+                    SttError::TranscriptionError(format!(
+                        "Failed to create whisper state: {}",
+                        e
+                    ))
+                })?;
+                guard.cached_state = Some(s);
+                guard.cached_state.as_mut().unwrap()
+            }
+        };
+
+        // Configure inference parameters
+        let mut params = FullParams::new(SamplingStrategy::Greedy { best_of: 1 });
+        params.set_language(Some("en"));
+        params.set_n_threads(n_threads);
+        params.set_print_special(false);
+        params.set_print_progress(false);
+        params.set_print_realtime(false);
+        params.set_print_timestamps(false);
+        params.set_single_segment(true);
+        params.set_no_timestamps(true);
+        // Suppress non-speech tokens to reduce hallucination on silence
+        params.set_suppress_non_speech_tokens(true);
+
+        // Run inference
+        state.full(params, audio).map_err(|e| {
+            SttError::TranscriptionError(format!("Whisper inference failed: {}", e))
+        })?;
+
+        // Collect transcribed text from all segments
+        let num_segments = state.full_n_segments().map_err(|e| {
+            SttError::TranscriptionError(format!("Failed to get segment count: {}", e))
+        })?;
+
+        let mut text = String::new();
+        for i in 0..num_segments {
+            if let Ok(seg) = state.full_get_segment_text(i) {
+                let trimmed: &str = seg.trim();
+                if !trimmed.is_empty() {
+                    if !text.is_empty() {
+                        text.push(' ');
+                    }
+                    text.push_str(trimmed);
+                }
+            }
+        }
+
+        tracing::info!(
+            segments = num_segments,
+            text_len = text.len(),
+            "Whisper transcription complete"
+        );
+
+        Ok(text)
+    }
+
     impl SttEngine for WhisperStt {
         fn transcribe(&self, audio: &[f32]) -> Result<String, SttError> {
             if !self.is_ready() {
@@ -311,69 +416,7 @@ mod whisper_real {
                 "Running whisper inference"
             );
 
-            let mut guard = self.inner.lock().map_err(|e| {
-                SttError::TranscriptionError(format!("Failed to lock whisper context: {}", e))
-            })?;
-
-            // Lazily create or reuse the cached WhisperState
-            let state = match guard.cached_state.as_mut() {
-                Some(s) => s,
-                None => {
-                    tracing::info!("Creating whisper state (first transcription)");
-                    let s = guard.ctx.create_state().map_err(|e| {
-                        SttError::TranscriptionError(format!(
-                            "Failed to create whisper state: {}",
-                            e
-                        ))
-                    })?;
-                    guard.cached_state = Some(s);
-                    guard.cached_state.as_mut().unwrap()
-                }
-            };
-
-            // Configure inference parameters
-            let mut params = FullParams::new(SamplingStrategy::Greedy { best_of: 1 });
-            params.set_language(Some("en"));
-            params.set_n_threads(self.n_threads);
-            params.set_print_special(false);
-            params.set_print_progress(false);
-            params.set_print_realtime(false);
-            params.set_print_timestamps(false);
-            params.set_single_segment(true);
-            params.set_no_timestamps(true);
-            // Suppress non-speech tokens to reduce hallucination on silence
-            params.set_suppress_non_speech_tokens(true);
-
-            // Run inference
-            state.full(params, audio).map_err(|e| {
-                SttError::TranscriptionError(format!("Whisper inference failed: {}", e))
-            })?;
-
-            // Collect transcribed text from all segments
-            let num_segments = state.full_n_segments().map_err(|e| {
-                SttError::TranscriptionError(format!("Failed to get segment count: {}", e))
-            })?;
-
-            let mut text = String::new();
-            for i in 0..num_segments {
-                if let Ok(seg) = state.full_get_segment_text(i) {
-                    let trimmed: &str = seg.trim();
-                    if !trimmed.is_empty() {
-                        if !text.is_empty() {
-                            text.push(' ');
-                        }
-                        text.push_str(trimmed);
-                    }
-                }
-            }
-
-            tracing::info!(
-                segments = num_segments,
-                text_len = text.len(),
-                "Whisper transcription complete"
-            );
-
-            Ok(text)
+            run_inference(&self.inner, self.n_threads, audio)
         }
 
         fn transcribe_streaming(&self, audio_chunk: &[f32]) -> Result<Option<String>, SttError> {
@@ -455,13 +498,15 @@ mod whisper_stub {
             })
         }
 
+        /// No-op: the stub has no model to warm up.
+        pub fn warm_up(&self) {}
+
         /// Create from a model size name, resolving the path in the data directory.
         ///
-        /// Standard model paths: `{data_dir}/models/ggml-{size}.en.bin`
+        /// Standard model paths: `{data_dir}/models/ggml-{size}.en.bin`, or the
+        /// int8 `ggml-{size}.en-q8_0.bin` when present (see `model_path_for_size`).
         pub fn from_model_size(data_dir: &Path, size: &str) -> Result<Self, SttError> {
-            let model_file = format!("ggml-{}.en.bin", size);
-            let model_path = data_dir.join("models").join(model_file);
-            Self::new(&model_path)
+            Self::new(&model_path_for_size(data_dir, size))
         }
     }
 
@@ -583,6 +628,13 @@ impl SttAdapter {
             Self::Whisper(e) => e.is_ready(),
         }
     }
+
+    /// Start a background warm-up inference. Returns immediately.
+    pub fn warm_up(&self) {
+        match self {
+            Self::Whisper(e) => e.warm_up(),
+        }
+    }
 }
 
 /// Create an STT engine from configuration.
@@ -630,6 +682,27 @@ pub fn create_stt_engine(
 
 // ── Helpers ─────────────────────────────────────────────────────────
 
+/// Path of the int8-quantized GGML model for `size`
+/// (`{data_dir}/models/ggml-{size}.en-q8_0.bin`).
+fn quantized_model_path(data_dir: &Path, size: &str) -> PathBuf {
+    data_dir
+        .join("models")
+        .join(format!("ggml-{}.en-q8_0.bin", size))
+}
+
+/// Resolve the model file for `size`, preferring the int8-quantized
+/// variant when it has been downloaded: about half the weight bytes of
+/// the f16 model, so inference moves less memory per decode step.
+fn model_path_for_size(data_dir: &Path, size: &str) -> PathBuf {
+    let quantized = quantized_model_path(data_dir, size);
+    if quantized.exists() {
+        return quantized;
+    }
+    data_dir
+        .join("models")
+        .join(format!("ggml-{}.en.bin", size))
+}
+
 /// Guess the model size from the file path (e.g., "ggml-base.en.bin" -> "base").
 fn guess_model_size(path: &Path) -> String {
     let stem = path
@@ -758,6 +831,26 @@ mod tests {
         assert_eq!(guess_model_size(Path::new("custom-model.bin")), "unknown");
     }
 
+    #[test]
+    fn test_model_path_prefers_quantized() {
+        let data_dir = std::env::temp_dir().join("voice-mirror-test-q8");
+        let models_dir = data_dir.join("models");
+        std::fs::create_dir_all(&models_dir).unwrap();
+        let quantized = models_dir.join("ggml-tiny.en-q8_0.bin");
+        let _ = std::fs::remove_file(&quantized);
+
+        assert_eq!(
+            model_path_for_size(&data_dir, "tiny"),
+            models_dir.join("ggml-tiny.en.bin")
+        );
+
+        std::fs::write(&quantized, b"").unwrap();
+        assert_eq!(model_path_for_size(&data_dir, "tiny"), quantized);
+        assert_eq!(guess_model_size(&quantized), "tiny");
+
+        let _ = std::fs::remove_dir_all(&data_dir);
+    }
+
     #[test]
     fn test_create_stt_engine_unknown() {
         let data_dir = PathBuf::from("/tmp/voice-mirror-test");
@@ -6,10 +6,11 @@
 //!
 //! Audio output is f32 PCM samples suitable for playback via rodio.
 
+use std::borrow::Cow;
 use std::future::Future;
 use std::pin::Pin;
 use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::Arc;
+use std::sync::{Arc, Mutex};
 use std::time::{SystemTime, UNIX_EPOCH};
 
 // ── TTS Engine Trait ────────────────────────────────────────────────
@@ -46,6 +47,23 @@ pub trait TtsEngine: Send + Sync {
         })
     }
 
+    /// Whether several `synthesize` futures can usefully be in flight at
+    /// once.
+    ///
+    /// True for network engines, whose futures mostly wait on I/O. Local
+    /// engines that render inside the future would just run the phrases
+    /// one after another while holding a runtime worker, so they keep the
+    /// default of one phrase at a time.
+    fn overlaps_synthesis(&self) -> bool {
+        false
+    }
+
+    /// Run a throwaway synthesis so the first real phrase doesn't pay the
+    /// engine's one-time setup cost.
+    ///
+    /// Blocking; call it off the UI thread. The default does nothing.
+    fn warm_up(&self) {}
+
     /// Interrupt any in-progress synthesis.
     fn stop(&self);
 
@@ -252,6 +270,10 @@ const TRUSTED_CLIENT_TOKEN: &str = "6A5AA1D4EAFF4E9FB37E23D68491D6F4";
 /// Windows epoch offset: seconds between 1601-01-01 and 1970-01-01.
 const WIN_EPOCH: u64 = 11_644_473_600;
 
+/// Last generated token and the 5-minute window it belongs to. The token
+/// only changes when the window does, so every phrase in between reuses it.
+static SEC_MS_GEC: Mutex<Option<(u64, String)>> = Mutex::new(None);
+
 /// Generate the Sec-MS-GEC security token for Edge TTS.
 ///
 /// Replicates the Python `edge-tts` DRM logic:
@@ -259,6 +281,8 @@ const WIN_EPOCH: u64 = 11_644_473_600;
 /// 2. Round down to nearest 300 seconds (5 minutes).
 /// 3. Convert to Windows file-time ticks (100-nanosecond intervals).
 /// 4. SHA-256 hash of "{ticks}{TRUSTED_CLIENT_TOKEN}" -> uppercase hex.
+///
+/// The result is cached for the rest of its 5-minute window.
 fn generate_sec_ms_gec() -> String {
     let unix_secs = SystemTime::now()
         .duration_since(UNIX_EPOCH)
@@ -266,12 +290,31 @@ fn generate_sec_ms_gec() -> String {
         .as_secs();
     let mut ticks = unix_secs + WIN_EPOCH;
     ticks -= ticks % 300; // round down to 5-minute boundary
+
+    let mut cached = SEC_MS_GEC.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some((window, token)) = cached.as_ref() {
+        if *window == ticks {
+            return token.clone();
+        }
+    }
+
     let ticks_100ns = ticks as u128 * 10_000_000; // seconds -> 100ns intervals
     let to_hash = format!("{}{}", ticks_100ns, TRUSTED_CLIENT_TOKEN);
     let hash = sha256(to_hash.as_bytes());
-    hex_encode_upper(&hash)
+    let token = hex_encode_upper(&hash);
+    *cached = Some((ticks, token.clone()));
+    token
 }
 
+/// `speech.config` message sent at the start of every Edge TTS connection.
+const EDGE_SPEECH_CONFIG_MSG: &str =
+    "X-Timestamp:Thu Jan 01 1970 00:00:00 GMT+0000 (Coordinated Universal Time)\r\n\
+     Content-Type:application/json; charset=utf-8\r\n\
+     Path:speech.config\r\n\r\n\
+     {\"context\":{\"synthesis\":{\"audio\":{\"metadataoptions\":\
+     {\"sentenceBoundaryEnabled\":\"false\",\"wordBoundaryEnabled\":\"false\"},\
+     \"outputFormat\":\"audio-24khz-48kbitrate-mono-mp3\"}}}}";
+
 // ── Edge TTS Helpers ────────────────────────────────────────────────
 
 /// Escape XML special characters for SSML.
@@ -291,7 +334,9 @@ fn xml_escape(s: &str) -> String {
 }
 
 /// Decode MP3 bytes to mono f32 PCM samples using Symphonia.
-fn decode_mp3_to_f32(mp3_bytes: &[u8]) -> Result<Vec<f32>, TtsError> {
+///
+/// Takes ownership of the bytes so they can back the media stream directly.
+fn decode_mp3_to_f32(mp3_bytes: Vec<u8>) -> Result<Vec<f32>, TtsError> {
     use symphonia::core::audio::SampleBuffer;
     use symphonia::core::codecs::DecoderOptions;
     use symphonia::core::formats::FormatOptions;
@@ -299,9 +344,14 @@ fn decode_mp3_to_f32(mp3_bytes: &[u8]) -> Result<Vec<f32>, TtsError> {
     use symphonia::core::meta::MetadataOptions;
     use symphonia::core::probe::Hint;
 
-    // .to_vec() is required: MediaSourceStream::new takes Box<dyn MediaSource> which
-    // implies 'static, so Cursor<&[u8]> (borrowed) cannot be used here.
-    let cursor = std::io::Cursor::new(mp3_bytes.to_vec());
+    // Edge streams 48 kbit/s mono MP3 at 24 kHz: 6000 bytes per second of
+    // audio, i.e. 4 samples per byte. Sizing the output up front avoids
+    // regrowing (and recopying) it as packets are decoded.
+    let estimated_samples = mp3_bytes.len() * 4;
+
+    // MediaSourceStream::new takes Box<dyn MediaSource> which implies 'static,
+    // so the cursor must own its bytes (Cursor<&[u8]> cannot be used here).
+    let cursor = std::io::Cursor::new(mp3_bytes);
     let mss = MediaSourceStream::new(Box::new(cursor), Default::default());
 
     let mut hint = Hint::new();
@@ -331,7 +381,10 @@ fn decode_mp3_to_f32(mp3_bytes: &[u8]) -> Result<Vec<f32>, TtsError> {
         .make(&track.codec_params, &DecoderOptions::default())
         .map_err(|e| TtsError::SynthesisError(format!("MP3 decoder init failed: {}", e)))?;
 
-    let mut all_samples = Vec::new();
+    let mut all_samples = Vec::with_capacity(estimated_samples);
+    // Interleaved conversion buffer, reused across packets and only
+    // reallocated when a packet is larger than any seen so far.
+    let mut sample_buf: Option<SampleBuffer<f32>> = None;
 
     loop {
         let packet = match format.next_packet() {
@@ -357,9 +410,14 @@ fn decode_mp3_to_f32(mp3_bytes: &[u8]) -> Result<Vec<f32>, TtsError> {
         };
         let spec = *decoded.spec();
         let duration = decoded.capacity();
-        let mut sample_buf = SampleBuffer::<f32>::new(duration as u64, spec);
-        sample_buf.copy_interleaved_ref(decoded);
-        let samples = sample_buf.samples();
+        let needed = duration * spec.channels.count();
+        if sample_buf.as_ref().is_some_and(|b| b.capacity() < needed) {
+            sample_buf = None;
+        }
+        let buf =
+            sample_buf.get_or_insert_with(|| SampleBuffer::<f32>::new(duration as u64, spec));
+        buf.copy_interleaved_ref(decoded);
+        let samples = buf.samples();
 
         if channels == 1 {
             all_samples.extend_from_slice(samples);
@@ -514,14 +572,7 @@ impl EdgeTts {
 
         // Send speech.config message
         let request_id = uuid::Uuid::new_v4().as_simple().to_string();
-        let config_msg =
-            "X-Timestamp:Thu Jan 01 1970 00:00:00 GMT+0000 (Coordinated Universal Time)\r\n\
-             Content-Type:application/json; charset=utf-8\r\n\
-             Path:speech.config\r\n\r\n\
-             {\"context\":{\"synthesis\":{\"audio\":{\"metadataoptions\":\
-             {\"sentenceBoundaryEnabled\":\"false\",\"wordBoundaryEnabled\":\"false\"},\
-             \"outputFormat\":\"audio-24khz-48kbitrate-mono-mp3\"}}}}".to_string();
-        ws_send_text(&mut upgraded, &config_msg).await?;
+        ws_send_text(&mut upgraded, EDGE_SPEECH_CONFIG_MSG).await?;
 
         // Send SSML request
         let ssml = self.build_ssml(text);
@@ -594,9 +645,10 @@ impl EdgeTts {
         }
 
         // Decode MP3 to f32 PCM
-        let samples = decode_mp3_to_f32(&mp3_data)?;
+        let mp3_len = mp3_data.len();
+        let samples = decode_mp3_to_f32(mp3_data)?;
         tracing::info!(
-            mp3_bytes = mp3_data.len(),
+            mp3_bytes = mp3_len,
             pcm_samples = samples.len(),
             "Edge TTS synthesis complete"
         );
@@ -631,6 +683,10 @@ impl TtsEngine for EdgeTts {
         })
     }
 
+    fn overlaps_synthesis(&self) -> bool {
+        true
+    }
+
     fn stop(&self) {
         self.cancelled.store(true, Ordering::SeqCst);
     }
@@ -830,14 +886,16 @@ fn base64_encode(data: &[u8]) -> String {
 // ── Kokoro TTS (real ONNX implementation) ───────────────────────────
 #[cfg(feature = "onnx")]
 mod kokoro_impl {
-    use std::collections::HashMap;
+    use std::collections::{HashMap, VecDeque};
     use std::io::{Cursor, Read as _};
     use std::path::{Path, PathBuf};
     use std::process::Command;
     use std::sync::atomic::{AtomicBool, Ordering};
-    use std::sync::{Arc, Mutex};
+    use std::sync::{Arc, Mutex, OnceLock};
+    use std::time::{Duration, Instant};
 
     use byteorder::{LittleEndian, ReadBytesExt};
+    use ort::session::builder::GraphOptimizationLevel;
     use tracing::{debug, info, warn};
 
     use super::{TtsEngine, TtsError};
@@ -847,6 +905,28 @@ mod kokoro_impl {
     const MAX_PHONEME_TOKENS: usize = 510;
     /// Style embedding dimension.
     const STYLE_DIM: usize = 256;
+    /// Maximum number of synthesized phrases kept per engine.
+    const SYNTH_CACHE_CAPACITY: usize = 64;
+    /// Longest phrase (in bytes) eligible for caching. Recurring phrases are
+    /// short acknowledgements; caching long ones would only hold memory.
+    const SYNTH_CACHE_MAX_TEXT_LEN: usize = 100;
+
+    /// Resolved espeak-ng binary and optional data dir, cached after the
+    /// first successful lookup so synthesis doesn't re-probe the PATH.
+    static ESPEAK_NG: OnceLock<(PathBuf, Option<PathBuf>)> = OnceLock::new();
+
+    /// When the last espeak-ng lookup failed, if it did.
+    static ESPEAK_NG_MISSING_SINCE: Mutex<Option<Instant>> = Mutex::new(None);
+
+    /// How long a failed espeak-ng lookup is trusted before probing again.
+    const ESPEAK_NG_RETRY_AFTER: Duration = Duration::from_secs(30);
+
+    /// Parsed voice embeddings from the most recently loaded voices file.
+    ///
+    /// The pipeline recreates the engine on every voice restart; sharing the
+    /// parsed table avoids re-inflating and re-parsing the ~27 MB NPZ each time.
+    static VOICES_CACHE: Mutex<Option<(PathBuf, Arc<HashMap<String, VoiceData>>)>> =
+        Mutex::new(None);
 
     /// Per-voice style embeddings: maps voice name -> flat f32 array of shape (N, 1, 256).
     struct VoiceData {
@@ -858,7 +938,7 @@ mod kokoro_impl {
 
     impl VoiceData {
         /// Get the style vector for a given token count. Shape: (1, 256).
-        fn style_for_len(&self, token_count: usize) -> Result<Vec<f32>, TtsError> {
+        fn style_for_len(&self, token_count: usize) -> Result<&[f32], TtsError> {
             if self.num_entries == 0 {
                 return Err(TtsError::SynthesisError(
                     "Voice style data is empty".into(),
@@ -866,7 +946,54 @@ mod kokoro_impl {
             }
             let idx = token_count.min(self.num_entries - 1);
             let start = idx * STYLE_DIM;
-            Ok(self.data[start..start + STYLE_DIM].to_vec())
+            Ok(&self.data[start..start + STYLE_DIM])
+        }
+    }
+
+    /// Cache key: (voice name, phrase text).
+    type SynthKey = (String, String);
+
+    /// Small LRU of synthesized audio, so recurring phrases ("Okay.",
+    /// "Got it.") skip phonemization and inference entirely.
+    #[derive(Default)]
+    struct SynthCache {
+        entries: HashMap<SynthKey, Vec<f32>>,
+        /// Keys ordered from least to most recently used.
+        order: VecDeque<SynthKey>,
+    }
+
+    impl SynthCache {
+        fn get(&mut self, key: &SynthKey) -> Option<Vec<f32>> {
+            let audio = self.entries.get(key)?.clone();
+            self.touch(key);
+            Some(audio)
+        }
+
+        fn insert(&mut self, key: SynthKey, audio: Vec<f32>) {
+            if self.entries.insert(key.clone(), audio).is_some() {
+                self.touch(&key);
+                return;
+            }
+            self.order.push_back(key);
+            if self.order.len() > SYNTH_CACHE_CAPACITY {
+                if let Some(oldest) = self.order.pop_front() {
+                    self.entries.remove(&oldest);
+                }
+            }
+        }
+
+        fn clear(&mut self) {
+            self.entries.clear();
+            self.order.clear();
+        }
+
+        /// Mark `key` as most recently used.
+        fn touch(&mut self, key: &SynthKey) {
+            if let Some(pos) = self.order.iter().position(|k| k == key) {
+                if let Some(k) = self.order.remove(pos) {
+                    self.order.push_back(k);
+                }
+            }
         }
     }
 
@@ -878,14 +1005,21 @@ mod kokoro_impl {
         voice: Mutex<String>,
         speed: f32,
         cancelled: Arc<AtomicBool>,
+        model: Arc<KokoroModel>,
+        voices: Arc<HashMap<String, VoiceData>>,
+        synth_cache: Mutex<SynthCache>,
+    }
+
+    /// The ONNX session and phoneme vocabulary, shared with the blocking
+    /// tasks that run inference.
+    struct KokoroModel {
         session: Mutex<ort::session::Session>,
-        voices: HashMap<String, VoiceData>,
         vocab: HashMap<char, i64>,
     }
 
     // SAFETY: ort::Session is Send but not Sync by default; we protect it
     // with a Mutex so only one thread runs inference at a time.
-    unsafe impl Sync for KokoroTts {}
+    unsafe impl Sync for KokoroModel {}
 
     impl KokoroTts {
         /// Create a new Kokoro TTS engine loading model from `model_dir`.
@@ -893,8 +1027,17 @@ mod kokoro_impl {
         /// Expected files:
         /// - `{model_dir}/kokoro-v1.0.onnx` -- ONNX model
         /// - `{model_dir}/voices-v1.0.bin` -- Voice embeddings (NPZ)
+        ///
+        /// If `{model_dir}/kokoro-v1.0.int8.onnx` (the int8-quantized release)
+        /// is present it is loaded instead: roughly a quarter of the weight
+        /// bytes and faster matmuls on CPU.
         pub fn new(model_dir: &Path, voice: &str, speed: f32) -> Result<Self, TtsError> {
-            let model_path = model_dir.join("kokoro-v1.0.onnx");
+            let int8_path = model_dir.join("kokoro-v1.0.int8.onnx");
+            let model_path = if int8_path.exists() {
+                int8_path
+            } else {
+                model_dir.join("kokoro-v1.0.onnx")
+            };
             let voices_path = model_dir.join("voices-v1.0.bin");
 
             if !model_path.exists() {
@@ -910,19 +1053,33 @@ mod kokoro_impl {
                 )));
             }
 
+            // Leave half the cores for capture, STT and the UI
+            let intra_threads = std::thread::available_parallelism()
+                .map(|n| (n.get() / 2).max(1))
+                .unwrap_or(1);
+
             let session = ort::session::Session::builder()
                 .map_err(|e| {
                     TtsError::SynthesisError(format!("ONNX session builder failed: {}", e))
                 })?
+                .with_optimization_level(GraphOptimizationLevel::Level3)
+                .map_err(|e| {
+                    TtsError::SynthesisError(format!("ONNX optimization config failed: {}", e))
+                })?
+                .with_intra_threads(intra_threads)
+                .map_err(|e| {
+                    TtsError::SynthesisError(format!("ONNX thread config failed: {}", e))
+                })?
                 .commit_from_file(&model_path)
                 .map_err(|e| {
                     TtsError::SynthesisError(format!("ONNX model load failed: {}", e))
                 })?;
 
-            let voices = load_voices_npz(&voices_path)?;
+            let voices = cached_voices(&voices_path)?;
             info!(
                 model = %model_path.display(),
                 voices = voices.len(),
+                intra_threads,
                 "Kokoro TTS model loaded"
             );
 
@@ -932,9 +1089,12 @@ mod kokoro_impl {
                 voice: Mutex::new(voice.to_string()),
                 speed,
                 cancelled: Arc::new(AtomicBool::new(false)),
-                session: Mutex::new(session),
+                model: Arc::new(KokoroModel {
+                    session: Mutex::new(session),
+                    vocab,
+                }),
                 voices,
-                vocab,
+                synth_cache: Mutex::new(SynthCache::default()),
             })
         }
 
@@ -944,12 +1104,44 @@ mod kokoro_impl {
         }
 
         /// Change the playback speed.
+        ///
+        /// Clears the synthesis cache, since cached audio was rendered at the
+        /// previous speed.
         pub fn set_speed(&mut self, speed: f32) {
             self.speed = speed;
+            self.synth_cache.lock().unwrap().clear();
         }
 
         /// Find espeak-ng executable.
+        ///
+        /// The first successful lookup is cached for the process lifetime.
+        /// A failed lookup is remembered for `ESPEAK_NG_RETRY_AFTER` so every
+        /// phrase doesn't re-spawn the probe, while a later install is still
+        /// picked up.
         fn find_espeak_ng() -> Option<(PathBuf, Option<PathBuf>)> {
+            if let Some(found) = ESPEAK_NG.get() {
+                return Some(found.clone());
+            }
+            let mut missing_since = ESPEAK_NG_MISSING_SINCE
+                .lock()
+                .unwrap_or_else(|e| e.into_inner());
+            if missing_since.is_some_and(|at| at.elapsed() < ESPEAK_NG_RETRY_AFTER) {
+                return None;
+            }
+            match Self::locate_espeak_ng() {
+                Some(found) => {
+                    *missing_since = None;
+                    Some(ESPEAK_NG.get_or_init(|| found).clone())
+                }
+                None => {
+                    *missing_since = Some(Instant::now());
+                    None
+                }
+            }
+        }
+
+        /// Probe PATH and bundled locations for espeak-ng.
+        fn locate_espeak_ng() -> Option<(PathBuf, Option<PathBuf>)> {
             // 1. Check if espeak-ng is on PATH
             if let Ok(output) = Command::new("espeak-ng").arg("--version").output() {
                 if output.status.success() {
@@ -1024,7 +1216,9 @@ mod kokoro_impl {
                 ))),
             }
         }
+    }
 
+    impl KokoroModel {
         /// Convert IPA phoneme string to token IDs.
         fn tokenize(&self, phonemes: &str) -> Vec<i64> {
             phonemes
@@ -1033,12 +1227,17 @@ mod kokoro_impl {
                 .collect()
         }
 
-        /// Run inference for a single chunk of tokens.
+        /// Run inference for a single chunk of tokens, appending the audio to `out`.
+        ///
+        /// The output tensor is copied straight from ONNX Runtime's buffer into
+        /// `out`, avoiding an intermediate Vec per chunk.
         fn infer_chunk(
             &self,
             tokens: &[i64],
             voice_data: &VoiceData,
-        ) -> Result<Vec<f32>, TtsError> {
+            speed: f32,
+            out: &mut Vec<f32>,
+        ) -> Result<(), TtsError> {
             let token_count = tokens.len();
             let style = voice_data.style_for_len(token_count)?;
 
@@ -1060,7 +1259,7 @@ mod kokoro_impl {
 
             let style_tensor = ort::value::Tensor::from_array((
                 vec![1i64, STYLE_DIM as i64],
-                style.into_boxed_slice(),
+                Box::<[f32]>::from(style),
             ))
             .map_err(|e| {
                 TtsError::SynthesisError(format!("ONNX style tensor failed: {}", e))
@@ -1068,7 +1267,7 @@ mod kokoro_impl {
 
             let speed_tensor = ort::value::Tensor::from_array((
                 vec![1i64],
-                vec![self.speed].into_boxed_slice(),
+                vec![speed].into_boxed_slice(),
             ))
             .map_err(|e| {
                 TtsError::SynthesisError(format!("ONNX speed tensor failed: {}", e))
@@ -1094,7 +1293,64 @@ mod kokoro_impl {
                         e
                     ))
                 })?;
-            Ok(audio_data.to_vec())
+            out.extend_from_slice(audio_data);
+            Ok(())
+        }
+
+        /// Phonemize `text` and run it through the model chunk by chunk.
+        ///
+        /// Blocking. Returns the audio and whether synthesis was interrupted
+        /// part-way through.
+        fn render(
+            &self,
+            text: &str,
+            lang: &str,
+            voice_data: &VoiceData,
+            speed: f32,
+            cancelled: &AtomicBool,
+        ) -> Result<(Vec<f32>, bool), TtsError> {
+            let phonemes = KokoroTts::phonemize(text, lang)?;
+            let mut tokens = self.tokenize(&phonemes);
+
+            if tokens.is_empty() {
+                return Err(TtsError::SynthesisError(
+                    "No phoneme tokens for input text".into(),
+                ));
+            }
+
+            debug!(
+                phoneme_count = phonemes.len(),
+                token_count = tokens.len(),
+                "Phonemized"
+            );
+
+            let mut all_audio = Vec::new();
+            let mut interrupted = false;
+            const SPACE_TOKEN: i64 = 16;
+
+            while !tokens.is_empty() {
+                if cancelled.load(Ordering::SeqCst) {
+                    debug!("Kokoro synthesis interrupted");
+                    interrupted = true;
+                    break;
+                }
+
+                let chunk = if tokens.len() <= MAX_PHONEME_TOKENS {
+                    std::mem::take(&mut tokens)
+                } else {
+                    let search_end = MAX_PHONEME_TOKENS;
+                    let split_at = tokens[..search_end]
+                        .iter()
+                        .rposition(|&t| t == SPACE_TOKEN)
+                        .map(|p| p + 1)
+                        .unwrap_or(search_end);
+                    tokens.drain(..split_at).collect()
+                };
+
+                self.infer_chunk(&chunk, voice_data, speed, &mut all_audio)?;
+            }
+
+            Ok((all_audio, interrupted))
         }
     }
 
@@ -1115,9 +1371,21 @@ mod kokoro_impl {
 
                 let voice_name = self.voice.lock().unwrap().clone();
 
-                let voice_data = self.voices.get(&voice_name).ok_or_else(|| {
-                    TtsError::SynthesisError(format!("Unknown Kokoro voice: {}", voice_name))
-                })?;
+                let cache_key = (text.len() <= SYNTH_CACHE_MAX_TEXT_LEN)
+                    .then(|| (voice_name.clone(), text.clone()));
+                if let Some(key) = &cache_key {
+                    if let Some(audio) = self.synth_cache.lock().unwrap().get(key) {
+                        debug!(samples = audio.len(), "Kokoro synthesis cache hit");
+                        return Ok(audio);
+                    }
+                }
+
+                if !self.voices.contains_key(&voice_name) {
+                    return Err(TtsError::SynthesisError(format!(
+                        "Unknown Kokoro voice: {}",
+                        voice_name
+                    )));
+                }
 
                 // Detect language from voice prefix
                 let lang = match voice_name.chars().next() {
@@ -1126,45 +1394,19 @@ mod kokoro_impl {
                     _ => "en-us",
                 };
 
-                let phonemes = Self::phonemize(&text, lang)?;
-                let mut tokens = self.tokenize(&phonemes);
-
-                if tokens.is_empty() {
-                    return Err(TtsError::SynthesisError(
-                        "No phoneme tokens for input text".into(),
-                    ));
-                }
-
-                debug!(
-                    phoneme_count = phonemes.len(),
-                    token_count = tokens.len(),
-                    "Phonemized"
-                );
-
-                let mut all_audio = Vec::new();
-                const SPACE_TOKEN: i64 = 16;
-
-                while !tokens.is_empty() {
-                    if self.cancelled.load(Ordering::SeqCst) {
-                        debug!("Kokoro synthesis interrupted");
-                        break;
-                    }
-
-                    let chunk = if tokens.len() <= MAX_PHONEME_TOKENS {
-                        std::mem::take(&mut tokens)
-                    } else {
-                        let search_end = MAX_PHONEME_TOKENS;
-                        let split_at = tokens[..search_end]
-                            .iter()
-                            .rposition(|&t| t == SPACE_TOKEN)
-                            .map(|p| p + 1)
-                            .unwrap_or(search_end);
-                        tokens.drain(..split_at).collect()
-                    };
-
-                    let audio = self.infer_chunk(&chunk, voice_data)?;
-                    all_audio.extend_from_slice(&audio);
-                }
+                // Phonemization and inference block for the whole phrase, so
+                // run them on the blocking pool rather than a runtime worker.
+                let model = Arc::clone(&self.model);
+                let voices = Arc::clone(&self.voices);
+                let cancelled = Arc::clone(&self.cancelled);
+                let speed = self.speed;
+                let (all_audio, interrupted) = tokio::task::spawn_blocking(move || {
+                    model.render(&text, lang, &voices[&voice_name], speed, &cancelled)
+                })
+                .await
+                .map_err(|e| {
+                    TtsError::SynthesisError(format!("Kokoro synthesis task failed: {}", e))
+                })??;
 
                 if all_audio.is_empty() {
                     return Err(TtsError::SynthesisError(
@@ -1178,10 +1420,38 @@ mod kokoro_impl {
                     "Kokoro synthesis complete"
                 );
 
+                // Only complete renders are reusable
+                if let (Some(key), false) = (cache_key, interrupted) {
+                    self.synth_cache.lock().unwrap().insert(key, all_audio.clone());
+                }
+
                 Ok(all_audio)
             })
         }
 
+        /// Run one tiny inference so the first real phrase doesn't pay for
+        /// ONNX Runtime's memory planning and kernel selection.
+        ///
+        /// Feeds pre-phonemized tokens straight to the model, so espeak-ng is
+        /// not needed here. Failures are logged and otherwise ignored.
+        fn warm_up(&self) {
+            let start = std::time::Instant::now();
+            let voice_name = self.voice.lock().unwrap().clone();
+            let Some(voice_data) = self.voices.get(&voice_name) else {
+                warn!(voice = %voice_name, "Kokoro warm-up skipped: unknown voice");
+                return;
+            };
+            let tokens = self.model.tokenize("həlˈoʊ");
+            let mut scratch = Vec::new();
+            match self.model.infer_chunk(&tokens, voice_data, self.speed, &mut scratch) {
+                Ok(()) => info!(
+                    elapsed_ms = start.elapsed().as_millis() as u64,
+                    "Kokoro warm-up complete"
+                ),
+                Err(e) => warn!("Kokoro warm-up failed: {}", e),
+            }
+        }
+
         fn stop(&self) {
             self.cancelled.store(true, Ordering::SeqCst);
         }
@@ -1196,6 +1466,21 @@ mod kokoro_impl {
         }
     }
 
+    /// Get the voice embeddings for `path`, reusing the cached table when the
+    /// same voices file was already loaded.
+    fn cached_voices(path: &Path) -> Result<Arc<HashMap<String, VoiceData>>, TtsError> {
+        let mut cache = VOICES_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+        if let Some((cached_path, voices)) = cache.as_ref() {
+            if cached_path == path {
+                debug!(path = %path.display(), "Reusing cached Kokoro voices");
+                return Ok(Arc::clone(voices));
+            }
+        }
+        let voices = Arc::new(load_voices_npz(path)?);
+        *cache = Some((path.to_path_buf(), Arc::clone(&voices)));
+        Ok(voices)
+    }
+
     /// Load voice embeddings from an NPZ file (ZIP of .npy arrays).
     fn load_voices_npz(path: &Path) -> Result<HashMap<String, VoiceData>, TtsError> {
         let file = std::fs::File::open(path).map_err(|e| {
@@ -1527,6 +1812,26 @@ pub use kokoro_impl::KokoroTts;
 
 // ── TTS Engine Factory ──────────────────────────────────────────────
 
+/// Edge voice used when the configured voice belongs to another adapter.
+const DEFAULT_EDGE_VOICE: &str = "en-US-AriaNeural";
+
+/// Build the Edge TTS engine used in place of an unavailable adapter.
+///
+/// Voices from other adapters (e.g. Kokoro's "af_bella") are not valid
+/// Edge voices, so anything that isn't an Edge "...Neural" voice falls
+/// back to `DEFAULT_EDGE_VOICE`. The speed setting is kept.
+fn edge_fallback(voice: Option<&str>, speed: f32) -> Box<dyn TtsEngine> {
+    let v = voice
+        .filter(|v| v.ends_with("Neural"))
+        .unwrap_or(DEFAULT_EDGE_VOICE);
+    Box::new(EdgeTts::with_rate(v, edge_rate(speed)))
+}
+
+/// Convert a speed multiplier into Edge's percentage rate offset.
+fn edge_rate(speed: f32) -> i32 {
+    ((speed - 1.0) * 100.0) as i32
+}
+
 /// Create a TTS engine from configuration.
 ///
 /// # Arguments
@@ -1560,8 +1865,7 @@ pub fn create_tts_engine(
                             "Kokoro model not available ({}), falling back to Edge TTS",
                             e
                         );
-                        let ev = voice.unwrap_or("en-US-AriaNeural");
-                        Ok(Box::new(EdgeTts::new(ev)))
+                        Ok(edge_fallback(voice, speed))
                     }
                 }
             }
@@ -1573,21 +1877,18 @@ pub fn create_tts_engine(
             }
         }
         "edge" => {
-            let v = voice.unwrap_or("en-US-AriaNeural");
-            let rate = ((speed - 1.0) * 100.0) as i32;
-            Ok(Box::new(EdgeTts::with_rate(v, rate)))
+            let v = voice.unwrap_or(DEFAULT_EDGE_VOICE);
+            Ok(Box::new(EdgeTts::with_rate(v, edge_rate(speed))))
         }
         "openai-tts" => {
             // TODO: Implement OpenAI TTS adapter
             tracing::warn!("OpenAI TTS not yet implemented, falling back to Edge TTS");
-            let v = voice.unwrap_or("en-US-AriaNeural");
-            Ok(Box::new(EdgeTts::new(v)))
+            Ok(edge_fallback(voice, speed))
         }
         "elevenlabs" => {
             // TODO: Implement ElevenLabs TTS adapter
             tracing::warn!("ElevenLabs TTS not yet implemented, falling back to Edge TTS");
-            let v = voice.unwrap_or("en-US-AriaNeural");
-            Ok(Box::new(EdgeTts::new(v)))
+            Ok(edge_fallback(voice, speed))
         }
         other => Err(TtsError::SynthesisError(format!(
             "Unknown TTS adapter: {}",
@@ -1596,6 +1897,250 @@ pub fn create_tts_engine(
     }
 }
 
+// ── Markdown Stripping ──────────────────────────────────────────────
+
+/// Bytes that can introduce markdown syntax worth stripping before TTS.
+const MARKDOWN_MARKERS: &[u8] = b"*_`#[>~";
+
+/// Bytes that can open an inline construct (`!` for `![image](...)`).
+const INLINE_MARKERS: &[u8] = b"*_`[!~";
+
+/// What a recognized markdown construct is replaced with.
+enum MarkdownReplacement<'a> {
+    /// Drop the construct entirely (line-start markers).
+    Drop,
+    /// Replace with a single space (fenced code blocks).
+    Space,
+    /// Keep the inner text as-is (inline code).
+    Verbatim(&'a str),
+    /// Keep the inner text, stripping any markup nested inside it.
+    Inner(&'a str),
+}
+
+/// Whether `c` is a regex-style word character (for `_emphasis_` boundaries).
+fn is_word_char(c: char) -> bool {
+    c.is_alphanumeric() || c == '_'
+}
+
+/// Whether an emphasis marker ending just before byte `at` can open a span:
+/// like CommonMark, it must be followed by a non-whitespace character, so
+/// arithmetic such as `2 * 3 * 4` is left alone.
+fn opens_emphasis(text: &str, at: usize) -> bool {
+    text[at..].chars().next().is_some_and(|c| !c.is_whitespace())
+}
+
+/// Scan `[from..]` up to the first `stop` byte or newline and require
+/// `close` right there. Returns `(inner_end, construct_end)`.
+fn markdown_span(b: &[u8], from: usize, stop: u8, close: &[u8]) -> Option<(usize, usize)> {
+    let mut j = from;
+    while j < b.len() && b[j] != stop && b[j] != b'\n' {
+        j += 1;
+    }
+    if !b[j..].starts_with(close) {
+        return None;
+    }
+    Some((j, j + close.len()))
+}
+
+/// Find the first `close` after `[from]` on the same line that can end an
+/// emphasis span: like CommonMark, it must follow a non-whitespace
+/// character, so `*.rs and *.md` is left alone. The inner text is never
+/// empty. Returns `(inner_end, construct_end)`.
+fn emphasis_span(text: &str, from: usize, close: &[u8]) -> Option<(usize, usize)> {
+    let b = text.as_bytes();
+    for j in from + 1..b.len() {
+        if b[j] == b'\n' {
+            return None;
+        }
+        // `close` is ASCII, so a match is always on a char boundary
+        if b[j..].starts_with(close)
+            && !text[..j].chars().next_back().is_some_and(char::is_whitespace)
+        {
+            return Some((j, j + close.len()));
+        }
+    }
+    None
+}
+
+/// Match a heading, blockquote or list marker at the start of a line,
+/// including leading indentation. Returns the end of the marker.
+fn block_marker_end(b: &[u8], start: usize) -> Option<usize> {
+    let is_blank = |j: usize| matches!(b.get(j), Some(b' ' | b'\t'));
+    let skip_blanks = |mut j: usize| {
+        while is_blank(j) {
+            j += 1;
+        }
+        j
+    };
+
+    let i = skip_blanks(start);
+    match *b.get(i)? {
+        b'#' => {
+            let hashes = b[i..].iter().take_while(|&&c| c == b'#').count();
+            (hashes <= 6 && is_blank(i + hashes)).then(|| skip_blanks(i + hashes))
+        }
+        b'>' => Some(if is_blank(i + 1) { i + 2 } else { i + 1 }),
+        b'-' | b'*' | b'+' => is_blank(i + 1).then(|| skip_blanks(i + 1)),
+        b'0'..=b'9' => {
+            let digits = b[i..].iter().take_while(|c| c.is_ascii_digit()).count();
+            let dot = i + digits;
+            (b.get(dot) == Some(&b'.') && is_blank(dot + 1)).then(|| skip_blanks(dot + 1))
+        }
+        _ => None,
+    }
+}
+
+/// Recognize a markdown construct starting at byte `i`. `at_line_start`
+/// says whether the start of `text` is the start of a line.
+fn markdown_at(
+    text: &str,
+    i: usize,
+    at_line_start: bool,
+) -> Option<(usize, MarkdownReplacement<'_>)> {
+    use MarkdownReplacement::*;
+
+    let b = text.as_bytes();
+    if (i == 0 && at_line_start) || (i > 0 && b[i - 1] == b'\n') {
+        if let Some(end) = block_marker_end(b, i) {
+            return Some((end, Drop));
+        }
+    }
+
+    match b[i] {
+        b'`' if b[i..].starts_with(b"```") => {
+            // Fenced code blocks are not read aloud; an unclosed fence runs to the end
+            let end = text[i + 3..].find("```").map_or(b.len(), |p| i + 3 + p + 3);
+            Some((end, Space))
+        }
+        b'`' => {
+            let (inner_end, end) = markdown_span(b, i + 1, b'`', b"`")?;
+            Some((end, Verbatim(&text[i + 1..inner_end])))
+        }
+        b'!' | b'[' => {
+            // Images and links keep their alt/label text
+            let open = if b[i] == b'!' { i + 1 } else { i };
+            if b.get(open) != Some(&b'[') {
+                return None;
+            }
+            let (label_end, url_start) = markdown_span(b, open + 1, b']', b"](")?;
+            let (_, end) = markdown_span(b, url_start, b')', b")")?;
+            Some((end, Inner(&text[open + 1..label_end])))
+        }
+        b'*' | b'_' if b[i..].starts_with(&[b[i]; 3]) => {
+            // Bold italic: `***text***`
+            if !opens_emphasis(text, i + 3) {
+                return None;
+            }
+            let (inner_end, end) = emphasis_span(text, i + 3, &b[i..i + 3])?;
+            Some((end, Inner(&text[i + 3..inner_end])))
+        }
+        b'*' | b'_' | b'~' if b.get(i + 1) == Some(&b[i]) => {
+            if !opens_emphasis(text, i + 2) {
+                return None;
+            }
+            let (inner_end, end) = emphasis_span(text, i + 2, &b[i..i + 2])?;
+            Some((end, Inner(&text[i + 2..inner_end])))
+        }
+        b'*' => {
+            if !opens_emphasis(text, i + 1) {
+                return None;
+            }
+            let (inner_end, end) = emphasis_span(text, i + 1, b"*")?;
+            Some((end, Inner(&text[i + 1..inner_end])))
+        }
+        b'_' => {
+            // `_emphasis_` only at word boundaries, so snake_case survives
+            if text[..i].chars().next_back().is_some_and(is_word_char)
+                || !opens_emphasis(text, i + 1)
+            {
+                return None;
+            }
+            let (inner_end, end) = emphasis_span(text, i + 1, b"_")?;
+            if text[end..].chars().next().is_some_and(is_word_char) {
+                return None;
+            }
+            Some((end, Inner(&text[i + 1..inner_end])))
+        }
+        _ => None,
+    }
+}
+
+/// Append `text` with markdown stripped to `out`. Returns whether any
+/// markdown was found. `at_line_start` says whether `text` begins a line,
+/// so block markers are only recognized where they really open one.
+fn strip_markdown_into(text: &str, out: &mut String, at_line_start: bool) -> bool {
+    let mut changed = false;
+    let mut i = 0;
+    // Start of the pending run of plain text not yet copied to `out`
+    let mut run = 0;
+
+    let b = text.as_bytes();
+    while i < b.len() {
+        let Some((end, replacement)) = markdown_at(text, i, at_line_start) else {
+            // Jump straight to the next byte that could start a construct:
+            // an inline marker, or a newline (the line after it may open
+            // with a block marker). Plain runs are skipped with one scan.
+            i = if b[i] == b'\n' {
+                i + 1
+            } else {
+                b[i + 1..]
+                    .iter()
+                    .position(|c| *c == b'\n' || INLINE_MARKERS.contains(c))
+                    .map_or(b.len(), |p| i + 1 + p)
+            };
+            continue;
+        };
+        changed = true;
+        out.push_str(&text[run..i]);
+        match replacement {
+            MarkdownReplacement::Drop => {}
+            MarkdownReplacement::Space => out.push(' '),
+            MarkdownReplacement::Verbatim(inner) => out.push_str(inner),
+            MarkdownReplacement::Inner(inner) => {
+                // The inner text follows the opening marker, so it never
+                // starts a line of its own
+                strip_markdown_into(inner, out, false);
+            }
+        }
+        i = end;
+        run = end;
+    }
+
+    out.push_str(&text[run..]);
+    changed
+}
+
+/// Whether `text` contains anything `strip_markdown` might rewrite.
+fn has_markdown(text: &str) -> bool {
+    text.bytes().any(|b| MARKDOWN_MARKERS.contains(&b))
+        || text.lines().any(|line| {
+            let line = line.trim_start();
+            line.starts_with("- ")
+                || line.starts_with("+ ")
+                || line
+                    .split_once(". ")
+                    .is_some_and(|(n, _)| !n.is_empty() && n.bytes().all(|b| b.is_ascii_digit()))
+        })
+}
+
+/// Strip markdown formatting so TTS doesn't read syntax aloud.
+///
+/// Removes code blocks, heading/quote/list markers, emphasis and link
+/// syntax while keeping the readable text. This is a single hand-written
+/// pass over the bytes with one output allocation; plain text is
+/// returned borrowed without scanning for constructs at all.
+pub fn strip_markdown(text: &str) -> Cow<'_, str> {
+    if !has_markdown(text) {
+        return Cow::Borrowed(text);
+    }
+    let mut out = String::with_capacity(text.len());
+    if strip_markdown_into(text, &mut out, true) {
+        Cow::Owned(out)
+    } else {
+        Cow::Borrowed(text)
+    }
+}
+
 // ── Phrase Splitting ────────────────────────────────────────────────
 
 /// Split text into phrases suitable for incremental TTS synthesis.
@@ -1613,49 +2158,56 @@ pub fn split_into_phrases(text: &str) -> Vec<String> {
         return vec![trimmed.to_string()];
     }
 
+    // Scan boundaries over the original string and copy each phrase out
+    // once, rather than collecting chars and rebuilding phrases char by char.
+    // Every boundary character is ASCII, so jump between candidate bytes
+    // instead of decoding each char; ASCII bytes never occur inside a
+    // multi-byte UTF-8 sequence, so every hit is a char boundary.
     let mut phrases: Vec<String> = Vec::new();
-    let mut current = String::new();
-    let chars: Vec<char> = trimmed.chars().collect();
-    let len = chars.len();
-    let mut i = 0;
+    let mut start = 0;
+    let bytes = trimmed.as_bytes();
+    let mut pos = 0;
 
-    while i < len {
-        current.push(chars[i]);
+    while let Some(offset) = bytes[pos..]
+        .iter()
+        .position(|b| matches!(b, b'.' | b'!' | b'?' | b'\n'))
+    {
+        let end = pos + offset + 1;
+        let newline = bytes[end - 1] == b'\n';
 
         // Sentence boundary: punctuation followed by whitespace or end
-        let is_punct = matches!(chars[i], '.' | '!' | '?')
-            && (i + 1 >= len || chars[i + 1].is_whitespace());
+        let is_punct =
+            !newline && trimmed[end..].chars().next().map_or(true, char::is_whitespace);
 
         // Paragraph break
-        let is_para = chars[i] == '\n' && current.trim().len() > 10;
+        let is_para = newline && trimmed[start..end].trim().len() > 10;
 
         if is_punct || is_para {
-            let s = current.trim().to_string();
+            let s = trimmed[start..end].trim();
             if !s.is_empty() {
-                phrases.push(s);
+                phrases.push(s.to_string());
             }
-            current.clear();
             // Skip whitespace after boundary
-            while i + 1 < len && chars[i + 1].is_whitespace() {
-                i += 1;
-            }
+            start = trimmed.len() - trimmed[end..].trim_start().len();
+            pos = start;
+        } else {
+            pos = end;
         }
-        i += 1;
     }
 
     // Push remainder
-    let remainder = current.trim().to_string();
+    let remainder = trimmed[start..].trim();
     if !remainder.is_empty() {
         if remainder.len() < 15 {
             // Very short -- merge with last phrase
             if let Some(last) = phrases.last_mut() {
                 last.push(' ');
-                last.push_str(&remainder);
+                last.push_str(remainder);
             } else {
-                phrases.push(remainder);
+                phrases.push(remainder.to_string());
             }
         } else {
-            phrases.push(remainder);
+            phrases.push(remainder.to_string());
         }
     }
 
@@ -1687,10 +2239,57 @@ pub fn split_into_phrases(text: &str) -> Vec<String> {
     if merged.is_empty() {
         vec![trimmed.to_string()]
     } else {
+        split_first_phrase(&mut merged);
         merged
     }
 }
 
+/// Longest first phrase, in bytes, before it is broken up.
+///
+/// Playback cannot start until the first phrase is synthesized, so a long
+/// opening sentence is cut at a clause or word boundary within this budget.
+const FIRST_PHRASE_MAX_BYTES: usize = 120;
+
+/// Shortest piece, in bytes, `split_first_phrase` will leave on either
+/// side of a cut.
+const MIN_SPLIT_PIECE_BYTES: usize = 20;
+
+/// Break an over-long first phrase so time-to-first-audio stays short.
+///
+/// Prefers the last `,` `;` or `:` followed by a space within
+/// `FIRST_PHRASE_MAX_BYTES`, then the last space. The phrase is left as-is
+/// if either piece would be shorter than `MIN_SPLIT_PIECE_BYTES`.
+fn split_first_phrase(phrases: &mut Vec<String>) {
+    let Some(first) = phrases.first() else {
+        return;
+    };
+    if first.len() <= FIRST_PHRASE_MAX_BYTES {
+        return;
+    }
+
+    let mut budget = FIRST_PHRASE_MAX_BYTES;
+    while !first.is_char_boundary(budget) {
+        budget -= 1;
+    }
+    let head = &first[..budget];
+    let fits = |cut: usize| {
+        cut >= MIN_SPLIT_PIECE_BYTES && first.len() - cut >= MIN_SPLIT_PIECE_BYTES
+    };
+
+    let clause_cut = head
+        .rfind(|c| matches!(c, ',' | ';' | ':'))
+        .map(|i| i + 1)
+        .filter(|&cut| first[cut..].starts_with(' ') && fits(cut));
+    let Some(cut) = clause_cut.or_else(|| head.rfind(' ').filter(|&cut| fits(cut))) else {
+        return;
+    };
+
+    let rest = first[cut..].trim_start().to_string();
+    let opening = first[..cut].trim_end().to_string();
+    phrases[0] = opening;
+    phrases.insert(1, rest);
+}
+
 // ── Tests ───────────────────────────────────────────────────────────
 
 #[cfg(test)]
@@ -1752,6 +2351,34 @@ mod tests {
         assert!(joined.contains("Third"));
     }
 
+    #[test]
+    fn test_phrase_splitting_paragraphs_and_unicode() {
+        let text =
+            "Café au lait is lovely this morning\nThe naïve reader keeps going on and on and on. Fin!";
+        let result = split_into_phrases(text);
+        assert_eq!(
+            result,
+            vec![
+                "Café au lait is lovely this morning",
+                "The naïve reader keeps going on and on and on. Fin!",
+            ]
+        );
+    }
+
+    #[test]
+    fn test_phrase_splitting_shortens_first_phrase() {
+        let text = "When you open the settings panel you will find the voice options near the top, \
+                    and the output device list sits just underneath them for quick access. \
+                    That is all.";
+        let result = split_into_phrases(text);
+        assert_eq!(
+            result[0],
+            "When you open the settings panel you will find the voice options near the top,"
+        );
+        assert!(result[1].starts_with("and the output device list"));
+        assert!(result.iter().all(|p| !p.is_empty()));
+    }
+
     #[test]
     fn test_create_tts_engine_edge() {
         let engine = create_tts_engine("edge", Some("en-US-GuyNeural"), None);
@@ -1759,6 +2386,16 @@ mod tests {
         assert!(engine.unwrap().name().contains("Guy"));
     }
 
+    #[test]
+    fn test_create_tts_engine_fallback_voice() {
+        // Non-Edge voices fall back to the default Edge voice
+        let engine = create_tts_engine("openai-tts", Some("alloy"), None).unwrap();
+        assert!(engine.name().contains("AriaNeural"));
+
+        let engine = create_tts_engine("elevenlabs", Some("en-GB-RyanNeural"), None).unwrap();
+        assert!(engine.name().contains("RyanNeural"));
+    }
+
     #[test]
     fn test_create_tts_engine_kokoro() {
         let engine = create_tts_engine("kokoro", Some("af_bella"), Some(1.2));
@@ -1847,4 +2484,72 @@ mod tests {
         assert!(ssml_fast.contains("rate='+50%'"));
         assert!(ssml_fast.contains("Test &amp; &lt;escape&gt;"));
     }
+
+    #[test]
+    fn test_strip_markdown_plain_text_borrowed() {
+        let text = "Hello there. This is plain text, nothing to strip.";
+        assert!(matches!(strip_markdown(text), Cow::Borrowed(_)));
+
+        // Marker bytes that no rule matches don't force a copy either
+        assert!(matches!(strip_markdown("5 > 3, so #1 wins"), Cow::Borrowed(_)));
+    }
+
+    #[test]
+    fn test_strip_markdown_inline() {
+        assert_eq!(
+            strip_markdown("This is **bold**, *italic* and `code`."),
+            "This is bold, italic and code."
+        );
+        assert_eq!(
+            strip_markdown("See [the docs](https://example.com) for ~~more~~ details."),
+            "See the docs for more details."
+        );
+        assert_eq!(strip_markdown("keep snake_case_names"), "keep snake_case_names");
+    }
+
+    #[test]
+    fn test_strip_markdown_block() {
+        let text = "# Title\n\n- first item\n- second item\n1. numbered\n> quoted";
+        assert_eq!(
+            strip_markdown(text),
+            "Title\n\nfirst item\nsecond item\nnumbered\nquoted"
+        );
+        assert_eq!(
+            strip_markdown("Run this:\n```rust\nfn main() {}\n```\nDone."),
+            "Run this:\n \nDone."
+        );
+    }
+
+    #[test]
+    fn test_strip_markdown_nested() {
+        assert_eq!(strip_markdown("# **Title**"), "Title");
+        assert_eq!(strip_markdown("**run `make`** now"), "run make now");
+        assert_eq!(strip_markdown("* item with *emphasis*"), "item with emphasis");
+    }
+
+    #[test]
+    fn test_strip_markdown_emphasis_not_line_start() {
+        // Text inside a span doesn't start a line, so it keeps list-like prefixes
+        assert_eq!(strip_markdown("**1. Install**"), "1. Install");
+        assert_eq!(strip_markdown("**- note**"), "- note");
+        assert_eq!(strip_markdown("[# tag](https://example.com)"), "# tag");
+    }
+
+    #[test]
+    fn test_strip_markdown_spaced_asterisks() {
+        // A marker followed by whitespace doesn't open emphasis
+        assert_eq!(strip_markdown("2 * 3 * 4 = 24"), "2 * 3 * 4 = 24");
+        assert_eq!(strip_markdown("a ** b ** c"), "a ** b ** c");
+        assert_eq!(strip_markdown("x _ y _ z"), "x _ y _ z");
+        assert_eq!(strip_markdown("2 * 3 is *six*"), "2 * 3 is six");
+    }
+
+    #[test]
+    fn test_strip_markdown_mixed_runs() {
+        assert_eq!(strip_markdown("***x***"), "x");
+        assert_eq!(strip_markdown("a ***bold italic*** b"), "a bold italic b");
+        assert_eq!(strip_markdown("**a*b*c**"), "abc");
+        // A marker after whitespace can't close, so globs survive
+        assert_eq!(strip_markdown("src/*.rs and *.md"), "src/*.rs and *.md");
+    }
 }
@@ -19,19 +19,33 @@ pub fn compute_energy(samples: &[f32]) -> f32 {
     if samples.is_empty() {
         return 0.0;
     }
-    let sum: f32 = samples.iter().map(|s| s.abs()).sum();
-    sum / samples.len() as f32
+    // Sum into independent lanes: a single f32 accumulator forces a serial
+    // add chain (float addition isn't reassociated), while separate lanes
+    // let the compiler vectorize the loop.
+    let mut lanes = [0.0f32; ENERGY_LANES];
+    let mut chunks = samples.chunks_exact(ENERGY_LANES);
+    for chunk in &mut chunks {
+        for (lane, s) in lanes.iter_mut().zip(chunk) {
+            *lane += s.abs();
+        }
+    }
+    let tail: f32 = chunks.remainder().iter().map(|s| s.abs()).sum();
+    (lanes.iter().sum::<f32>() + tail) / samples.len() as f32
 }
 
+/// Number of parallel accumulators used by [`compute_energy`].
+const ENERGY_LANES: usize = 8;
+
 /// Compute the energy level from i16 samples.
 ///
-/// Converts to f32 range (-1.0 to 1.0) internally.
+/// Accumulates in integer arithmetic and scales to the f32 range
+/// (-1.0 to 1.0) once at the end, rather than converting every sample.
 pub fn compute_energy_i16(samples: &[i16]) -> f32 {
     if samples.is_empty() {
         return 0.0;
     }
-    let sum: f32 = samples.iter().map(|&s| (s as f32 / 32768.0).abs()).sum();
-    sum / samples.len() as f32
+    let sum: u64 = samples.iter().map(|&s| s.unsigned_abs() as u64).sum();
+    (sum as f64 / (samples.len() as f64 * 32768.0)) as f32
 }
 
 // ── VAD Processor ───────────────────────────────────────────────────
@@ -78,8 +92,17 @@ impl VadProcessor {
     ///
     /// Returns `true` if speech is detected in this frame.
     pub fn process_frame(&mut self, audio: &[f32]) -> bool {
+        self.process_frame_at(audio, Instant::now())
+    }
+
+    /// Process an audio frame captured at `now`.
+    ///
+    /// Same as [`process_frame`](Self::process_frame) but with an explicit
+    /// timestamp, so callers (and tests) can drive silence tracking without
+    /// depending on wall-clock time.
+    pub fn process_frame_at(&mut self, audio: &[f32], now: Instant) -> bool {
         let energy = compute_energy(audio);
-        self.update_state(energy)
+        self.update_state(energy, now)
     }
 
     /// Process an audio frame of i16 samples.
@@ -87,11 +110,11 @@ impl VadProcessor {
     /// Returns `true` if speech is detected in this frame.
     pub fn process_frame_i16(&mut self, audio: &[i16]) -> bool {
         let energy = compute_energy_i16(audio);
-        self.update_state(energy)
+        self.update_state(energy, Instant::now())
     }
 
     /// Update internal state based on computed energy level.
-    fn update_state(&mut self, energy: f32) -> bool {
+    fn update_state(&mut self, energy: f32, now: Instant) -> bool {
         // Update running average
         self.frame_count += 1;
         let alpha = 0.01_f32;
@@ -105,7 +128,7 @@ impl VadProcessor {
             self.silence_start = None;
         } else if self.silence_start.is_none() {
             // Silence just started
-            self.silence_start = Some(Instant::now());
+            self.silence_start = Some(now);
         }
 
         self.is_speech
@@ -194,6 +217,17 @@ mod tests {
         assert_eq!(compute_energy_i16(&silence), 0.0);
     }
 
+    #[test]
+    fn test_compute_energy_i16_matches_f32() {
+        let ints: Vec<i16> = (0..1280).map(|i| ((i * 97) % 65536 - 32768) as i16).collect();
+        let floats: Vec<f32> = ints.iter().map(|&s| s as f32 / 32768.0).collect();
+        let diff = (compute_energy_i16(&ints) - compute_energy(&floats)).abs();
+        assert!(diff < 1e-4, "i16 and f32 energy differ by {}", diff);
+
+        // i16::MIN must not overflow
+        assert!((compute_energy_i16(&[i16::MIN; 4]) - 1.0).abs() < 1e-6);
+    }
+
     #[test]
     fn test_vad_silence_detection() {
         let mut vad = VadProcessor::new(0.01);
@@ -240,6 +274,23 @@ mod tests {
         assert!(vad.silence_duration().is_none());
     }
 
+    #[test]
+    fn test_vad_silence_exceeded() {
+        let mut vad = VadProcessor::new(0.01);
+        let silence = vec![0.0f32; 1280];
+        let Some(earlier) = Instant::now().checked_sub(Duration::from_secs(3)) else {
+            return; // Monotonic clock too close to its origin to backdate
+        };
+
+        vad.process_frame_at(&silence, earlier);
+        assert!(vad.silence_exceeded(Duration::from_secs(2)));
+        assert!(!vad.silence_exceeded(Duration::from_secs(10)));
+
+        // Later silent frames don't restart the timer
+        vad.process_frame(&silence);
+        assert!(vad.silence_exceeded(Duration::from_secs(2)));
+    }
+
     #[test]
     fn test_vad_reset() {
         let mut vad = VadProcessor::new(0.01);